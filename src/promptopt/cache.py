@@ -1,32 +1,122 @@
 from __future__ import annotations
 
-import json
-from datetime import datetime
+import atexit
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from promptopt import jsonio
+from promptopt.bundle_store import now_iso
 from promptopt.models import EvaluationResult
 
+MEMO_MAXSIZE = 4096
+
+_writer: ThreadPoolExecutor | None = None
+
+
+def _background_writer() -> ThreadPoolExecutor | None:
+    """
+    Single-worker executor that drains cache writes off the rollout path.
+
+    Safe because same-process readers are served from the in-memory memo, so
+    nothing observes the file before the queued write lands. Set
+    PROMPTOPT_SYNC_WRITES=1 to write inline instead.
+    """
+    if os.getenv("PROMPTOPT_SYNC_WRITES"):
+        return None
+    global _writer
+    if _writer is None:
+        _writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="promptopt-cache-write")
+        atexit.register(_writer.shutdown, wait=True)
+    return _writer
+
+
+def _write_blobs(writes: list[tuple[Path, bytes]]) -> None:
+    for path, blob in writes:
+        path.write_bytes(blob)
+
 
 class EvaluationCache:
     def __init__(self, root: Path):
         self.root = Path(root)
+        self._memo: OrderedDict[tuple[str, str], EvaluationResult] = OrderedDict()
+        # get_many fans disk misses out over worker threads, and each miss
+        # lands back in the memo via get(); move_to_end/popitem on a shared
+        # OrderedDict are not safe to interleave, so every memo access takes
+        # this lock.
+        self._memo_lock = threading.Lock()
 
     def _path(self, run_id: str, bundle_hash: str) -> Path:
         return self.root / "evals" / bundle_hash / f"{run_id}.json"
 
+    def _remember(self, key: tuple[str, str], evaluation: EvaluationResult) -> None:
+        with self._memo_lock:
+            self._memo[key] = evaluation
+            self._memo.move_to_end(key)
+            while len(self._memo) > MEMO_MAXSIZE:
+                self._memo.popitem(last=False)
+
+    def _lookup(self, key: tuple[str, str]) -> EvaluationResult | None:
+        with self._memo_lock:
+            memoized = self._memo.get(key)
+            if memoized is not None:
+                self._memo.move_to_end(key)
+            return memoized
+
     def get(self, run_id: str, bundle_hash: str) -> EvaluationResult | None:
         """
         Load a cached evaluation if available.
 
         Cache key is (run_id + bundle_hash) so the same run can be re-scored
-        across different candidate bundles.
+        across different candidate bundles. Hits are memoized in memory so
+        repeated lookups (GEPA's Pareto/merge steps re-score the same
+        candidate x run pairs) skip the disk read and JSON decode.
         """
-        path = self._path(run_id, bundle_hash)
-        if not path.exists():
+        key = (run_id, bundle_hash)
+        memoized = self._lookup(key)
+        if memoized is not None:
+            return memoized
+
+        # EAFP: one open instead of a stat-then-open pair on the hit path,
+        # which is the common case during GEPA re-scoring.
+        try:
+            data = jsonio.load_path(self._path(run_id, bundle_hash))
+        except FileNotFoundError:
             return None
-        data = json.loads(path.read_text())
         evaluation = data.get("evaluation", data)
-        return EvaluationResult.from_dict(evaluation)
+        result = EvaluationResult.from_dict(evaluation)
+        self._remember(key, result)
+        return result
+
+    def get_many(self, run_ids: list[str], bundle_hash: str) -> dict[str, EvaluationResult | None]:
+        """
+        Probe the cache for a whole batch at once.
+
+        Memo hits are collected first; the remaining keys are read from disk
+        concurrently (the backend is file-per-key, so the reads are
+        independent opens that overlap their syscall latency). Returns every
+        requested run_id, mapped to None on a miss.
+        """
+        run_ids = list(run_ids)
+        results: dict[str, EvaluationResult | None] = {}
+        missing: list[str] = []
+        for run_id in run_ids:
+            memoized = self._lookup((run_id, bundle_hash))
+            results[run_id] = memoized
+            if memoized is None:
+                missing.append(run_id)
+
+        if len(missing) == 1:
+            results[missing[0]] = self.get(missing[0], bundle_hash)
+        elif missing:
+            with ThreadPoolExecutor(max_workers=min(8, len(missing))) as pool:
+                for run_id, result in zip(
+                    missing, pool.map(lambda rid: self.get(rid, bundle_hash), missing)
+                ):
+                    results[run_id] = result
+        return results
 
     def set(self, run_id: str, bundle_hash: str, evaluation: EvaluationResult) -> None:
         """Persist an evaluation to disk for reuse in later GEPA iterations."""
@@ -35,7 +125,46 @@ class EvaluationCache:
         payload = {
             "run_id": run_id,
             "bundle_hash": bundle_hash,
-            "cached_at": datetime.utcnow().isoformat() + "Z",
+            "cached_at": now_iso(),
             "evaluation": evaluation.to_dict(),
         }
-        path.write_text(json.dumps(payload, indent=2))
+        self._remember((run_id, bundle_hash), evaluation)
+        blob = jsonio.dump_bytes(payload)
+        writer = _background_writer()
+        if writer is None:
+            path.write_bytes(blob)
+        else:
+            writer.submit(path.write_bytes, blob)
+
+    def set_many(self, items: list[tuple[str, str, EvaluationResult]]) -> None:
+        """
+        Persist a batch of evaluations with a single writer dispatch.
+
+        All entries are memoized and serialized up front (one mkdir per
+        bundle-hash directory), then handed to the background writer as one
+        task instead of one queue hop per run.
+        """
+        if not items:
+            return
+        writes: list[tuple[Path, bytes]] = []
+        made_dirs: set[Path] = set()
+        for run_id, bundle_hash, evaluation in items:
+            path = self._path(run_id, bundle_hash)
+            parent = path.parent
+            if parent not in made_dirs:
+                parent.mkdir(parents=True, exist_ok=True)
+                made_dirs.add(parent)
+            payload = {
+                "run_id": run_id,
+                "bundle_hash": bundle_hash,
+                "cached_at": now_iso(),
+                "evaluation": evaluation.to_dict(),
+            }
+            self._remember((run_id, bundle_hash), evaluation)
+            writes.append((path, jsonio.dump_bytes(payload)))
+
+        writer = _background_writer()
+        if writer is None:
+            _write_blobs(writes)
+        else:
+            writer.submit(_write_blobs, writes)
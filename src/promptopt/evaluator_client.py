@@ -1,47 +1,58 @@
 from __future__ import annotations
 
-import json
+import asyncio
+import os
+import re
 import shlex
+import signal
 import subprocess
 import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
 
+from promptopt import jsonio
 from promptopt.models import EvaluationResult, PracticeAttribution
 from promptopt.status import emit_status_event, utc_timestamp
 
 HEARTBEAT_SECONDS = 15
-POLL_INTERVAL_SECONDS = 0.25
 
 
-def _ensure_plain_ui(cli_command: str) -> list[str]:
-    """Append `--ui plain` unless the command already specifies UI mode."""
+@lru_cache(maxsize=64)
+def _ensure_plain_ui(cli_command: str) -> tuple[str, ...]:
+    """
+    Append `--ui plain` unless the command already specifies UI mode.
+
+    The tokenized prefix is cached per command string so repeated rollouts
+    skip re-running shlex on every evaluation.
+    """
     tokens = shlex.split(cli_command)
     for index, token in enumerate(tokens):
         if token in ("--ui", "-u"):
             if index + 1 < len(tokens):
-                return tokens
+                return tuple(tokens)
         if token.startswith("--ui="):
-            return tokens
-    return tokens + ["--ui", "plain"]
-
-
-def _get_ci(data: dict, key: str, default=None):
-    """Case-insensitive lookup helper for evaluator.json fields."""
-    for candidate in (key, key.lower(), key.upper()):
-        if candidate in data:
-            return data[candidate]
-    for k, v in data.items():
-        if k.lower() == key.lower():
-            return v
-    return default
+            return tuple(tokens)
+    return (*tokens, "--ui", "plain")
 
 
 def _parse_practice_attribution(data: dict) -> PracticeAttribution:
-    """Normalize practice attribution block from evaluator.json."""
-    practice = _get_ci(data, "practice_attribution", {}) or {}
-    selected = _get_ci(practice, "selected_practices", []) or []
-    offending = _get_ci(practice, "offending_practices", []) or []
-    notes_by = _get_ci(practice, "notes_by_practice", {}) or {}
+    """
+    Normalize practice attribution block from evaluator.json.
+
+    Expects lowercased top-level keys; the nested block gets the same
+    one-pass lowercased view so lookups stay O(1) regardless of how the
+    evaluator cased its field names.
+    """
+    practice = data.get("practice_attribution") or {}
+    if isinstance(practice, dict):
+        practice = {str(key).lower(): value for key, value in practice.items()}
+    else:
+        practice = {}
+    selected = practice.get("selected_practices") or []
+    offending = practice.get("offending_practices") or []
+    notes_by = practice.get("notes_by_practice") or {}
     normalized_notes = {}
     for key, value in dict(notes_by).items():
         if isinstance(value, list):
@@ -55,14 +66,35 @@ def _parse_practice_attribution(data: dict) -> PracticeAttribution:
     )
 
 
+# Fast path for the minimal fixed schema: exactly {"pass": ..., "score": ...}.
+# Anything richer (flags, notes, attribution) falls through to the JSON parser.
+_MINIMAL_RESULT_RE = re.compile(
+    rb'\A\s*\{\s*"pass"\s*:\s*(true|false)\s*,\s*"score"\s*:\s*(-?\d+(?:\.\d+)?)\s*\}\s*\Z'
+)
+
+
 def parse_evaluator_json(path: Path) -> EvaluationResult:
     """Parse evaluator.json into a typed EvaluationResult."""
-    data = json.loads(path.read_text())
-    passed = bool(_get_ci(data, "pass", False))
-    score = float(_get_ci(data, "score", 0.0))
-    flags = list(_get_ci(data, "flags", []) or [])
-    notes = list(_get_ci(data, "notes", []) or [])
-    practice_attribution = _parse_practice_attribution(data)
+    raw = path.read_bytes()
+    match = _MINIMAL_RESULT_RE.match(raw)
+    if match:
+        passed = match.group(1) == b"true"
+        score = float(match.group(2))
+        return EvaluationResult(
+            passed=passed,
+            score=score,
+            raw={"pass": passed, "score": score},
+        )
+
+    data = jsonio.loads(raw)
+    # One lowercased view of the top-level keys replaces repeated
+    # case-insensitive scans; only the six fields we extract get touched.
+    lower = {str(key).lower(): value for key, value in data.items()}
+    passed = bool(lower.get("pass", False))
+    score = float(lower.get("score", 0.0))
+    flags = list(lower.get("flags") or [])
+    notes = list(lower.get("notes") or [])
+    practice_attribution = _parse_practice_attribution(lower)
 
     return EvaluationResult(
         passed=passed,
@@ -74,6 +106,108 @@ def parse_evaluator_json(path: Path) -> EvaluationResult:
     )
 
 
+@lru_cache(maxsize=1024)
+def _ensure_out_dir(out_dir: str) -> None:
+    """mkdir -p once per output directory; retries reuse the same candidate/task dir."""
+    os.makedirs(out_dir, exist_ok=True)
+
+
+def _prepare_eval(
+    bundle_path: Path,
+    task_path: Path,
+    cli_command: str,
+    log_dir: Path,
+    run_label: str | None,
+) -> tuple[list[str], str, str, str, Path]:
+    """Build the CLI command line and output directory shared by sync/async paths."""
+    bundle_str = os.fspath(bundle_path)
+    task_str = os.fspath(task_path)
+
+    candidate_id = os.path.basename(bundle_str)
+    task_id = os.path.basename(task_str)
+    out_dir = Path(log_dir) / candidate_id / task_id
+    _ensure_out_dir(str(out_dir))
+
+    cmd = [
+        *_ensure_plain_ui(cli_command),
+        "--bundle",
+        bundle_str,
+        "--task",
+        task_str,
+        "--out",
+        str(out_dir),
+    ]
+
+    label = (run_label or f"{candidate_id}/{task_id}").strip() or f"{candidate_id}/{task_id}"
+    return cmd, label, candidate_id, task_id, out_dir
+
+
+def _load_result(out_dir: Path) -> EvaluationResult:
+    """Parse evaluator.json from the output directory, defaulting to a failed result."""
+    evaluator_json = out_dir / "evaluator.json"
+    if evaluator_json.exists():
+        try:
+            return parse_evaluator_json(evaluator_json)
+        except ValueError:
+            pass
+    return EvaluationResult(passed=False, score=0.0)
+
+
+def _kill_eval_process(process) -> None:
+    """
+    Kill a timed-out evaluator, taking its whole process group down.
+
+    The CLI spawns its own children (dotnet, git); killing only the direct
+    child leaves them running against the 900 s budget. Fall back to a plain
+    kill when no process group is available (e.g. non-POSIX or test doubles).
+    """
+    try:
+        os.killpg(process.pid, signal.SIGKILL)
+    except (AttributeError, OSError):
+        process.kill()
+    process.wait()
+
+
+@contextmanager
+def _open_child_logs(out_dir: Path):
+    """
+    Open per-eval stdout/stderr logs in binary append mode.
+
+    The CLI can emit megabytes of LLM output; routing it straight to files
+    avoids pipe buffers and UTF-8 decoding in the parent while keeping the
+    output available for debugging under out_dir.
+    """
+    with open(out_dir / "stdout.log", "ab") as stdout_log:
+        with open(out_dir / "stderr.log", "ab") as stderr_log:
+            yield stdout_log, stderr_log
+
+
+def _emit_eval_finished(
+    label: str,
+    candidate_id: str,
+    task_id: str,
+    attempt: int,
+    out_dir: Path,
+    key: str,
+    passed: bool,
+    score: float,
+    returncode: int | None,
+) -> None:
+    emit_status_event(
+        "eval_finished",
+        summary=f"eval run={label} pass={passed} score={score}",
+        run_label=label,
+        candidate_id=candidate_id,
+        task_id=task_id,
+        attempt=attempt,
+        out_dir=str(out_dir),
+        key=key,
+        passed=passed,
+        score=score,
+        returncode=returncode,
+    )
+
+
 def evaluate_bundle(
     bundle_path: Path,
     task_path: Path,
@@ -87,30 +221,14 @@ def evaluate_bundle(
 
     This function is the bridge between GEPA and the real agentic evaluation loop.
     """
-    bundle_path = Path(bundle_path)
-    task_path = Path(task_path)
-    log_dir = Path(log_dir)
-
-    candidate_id = bundle_path.name
-    task_id = task_path.name
-    out_dir = log_dir / candidate_id / task_id
-    out_dir.mkdir(parents=True, exist_ok=True)
-
-    cmd = _ensure_plain_ui(cli_command) + [
-        "--bundle",
-        str(bundle_path),
-        "--task",
-        str(task_path),
-        "--out",
-        str(out_dir),
-    ]
+    cmd, label, candidate_id, task_id, out_dir = _prepare_eval(
+        bundle_path, task_path, cli_command, log_dir, run_label
+    )
 
-    label = (run_label or f"{candidate_id}/{task_id}").strip() or f"{candidate_id}/{task_id}"
-    
     def _event_key(attempt: int) -> str:
         return f"{candidate_id}:{task_id}:attempt{attempt}"
 
-    def run_eval_once(attempt: int) -> int:
+    def run_eval_once(attempt: int, attempt_timeout: int) -> int:
         key = _event_key(attempt)
         started_at_utc = utc_timestamp()
         emit_status_event(
@@ -126,35 +244,50 @@ def evaluate_bundle(
             started_at_utc=started_at_utc,
             elapsed_seconds=0,
         )
-        process = subprocess.Popen(cmd, text=True)
-        started = time.monotonic()
-        next_heartbeat = started + HEARTBEAT_SECONDS
-
-        while True:
-            returncode = process.poll()
-            if returncode is not None:
-                return returncode
-
-            now = time.monotonic()
-            elapsed = now - started
-            if elapsed >= timeout_seconds:
-                process.kill()
-                process.wait()
-                emit_status_event(
-                    "eval_timeout",
-                    summary=f"eval run={label} timeout after {timeout_seconds}s",
-                    run_label=label,
-                    candidate_id=candidate_id,
-                    task_id=task_id,
-                    attempt=attempt,
-                    out_dir=str(out_dir),
-                    key=key,
-                    timeout_seconds=timeout_seconds,
-                    retry=attempt == 1,
-                )
-                raise subprocess.TimeoutExpired(cmd=cmd, timeout=timeout_seconds)
+        with _open_child_logs(out_dir) as (stdout_log, stderr_log):
+            # close_fds=False avoids per-fd bookkeeping (Python fds are
+            # non-inheritable by default, PEP 446); start_new_session puts
+            # the CLI and its children in their own process group so a
+            # timeout kill cannot leave orphaned grandchildren behind.
+            # Note: session creation disqualifies CPython's posix_spawn fast
+            # path and forces fork+exec — the orphan-free kill is worth it.
+            process = subprocess.Popen(
+                cmd,
+                stdout=stdout_log,
+                stderr=stderr_log,
+                close_fds=False,
+                start_new_session=True,
+            )
+            started = time.monotonic()
+            deadline = started + attempt_timeout
+
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    _kill_eval_process(process)
+                    emit_status_event(
+                        "eval_timeout",
+                        summary=f"eval run={label} timeout after {attempt_timeout}s",
+                        run_label=label,
+                        candidate_id=candidate_id,
+                        task_id=task_id,
+                        attempt=attempt,
+                        out_dir=str(out_dir),
+                        key=key,
+                        timeout_seconds=attempt_timeout,
+                        retry=attempt == 1,
+                    )
+                    raise subprocess.TimeoutExpired(cmd=cmd, timeout=attempt_timeout)
+
+                try:
+                    # Block in wait() until the child exits or the next
+                    # heartbeat is due: zero CPU between heartbeats and no
+                    # polling-interval rounding on exit detection.
+                    return process.wait(timeout=min(HEARTBEAT_SECONDS, remaining))
+                except subprocess.TimeoutExpired:
+                    pass
 
-            if now >= next_heartbeat:
+                elapsed = time.monotonic() - started
                 emit_status_event(
                     "eval_heartbeat",
                     summary=f"eval run={label} elapsed={int(elapsed)}s",
@@ -167,48 +300,212 @@ def evaluate_bundle(
                     elapsed_seconds=int(elapsed),
                     status="running",
                 )
-                next_heartbeat = now + HEARTBEAT_SECONDS
-
-            time.sleep(POLL_INTERVAL_SECONDS)
 
     try:
-        returncode = run_eval_once(attempt=1)
+        returncode = run_eval_once(attempt=1, attempt_timeout=timeout_seconds)
         attempt_used = 1
     except subprocess.TimeoutExpired:
         try:
-            returncode = run_eval_once(attempt=2)
+            # A rerun that hangs again rarely needs the full budget; halving
+            # it caps the worst case at 1.5x timeout instead of 2x.
+            returncode = run_eval_once(attempt=2, attempt_timeout=timeout_seconds // 2)
             attempt_used = 2
         except subprocess.TimeoutExpired:
+            _emit_eval_finished(label, candidate_id, task_id, 2, out_dir, _event_key(2), False, 0.0, None)
+            return EvaluationResult(passed=False, score=0.0)
+
+    evaluator_json = out_dir / "evaluator.json"
+
+    if returncode != 0 and not evaluator_json.exists():
+        _emit_eval_finished(
+            label, candidate_id, task_id, attempt_used, out_dir, _event_key(attempt_used), False, 0.0, returncode
+        )
+        try:
             emit_status_event(
-                "eval_finished",
-                summary=f"eval run={label} pass=False score=0.0",
+                "warning",
+                summary=f"warning: eval run={label} exited {returncode}; retrying because evaluator.json is missing",
+                message=f"eval run={label} exited {returncode}; retrying because evaluator.json is missing",
+            )
+            returncode = run_eval_once(attempt=attempt_used + 1, attempt_timeout=timeout_seconds)
+            attempt_used += 1
+        except subprocess.TimeoutExpired:
+            _emit_eval_finished(
+                label, candidate_id, task_id, attempt_used, out_dir, _event_key(attempt_used), False, 0.0, None
+            )
+            return EvaluationResult(passed=False, score=0.0)
+
+    result = _load_result(out_dir)
+    _emit_eval_finished(
+        label,
+        candidate_id,
+        task_id,
+        attempt_used,
+        out_dir,
+        _event_key(attempt_used),
+        result.passed,
+        result.score,
+        returncode,
+    )
+    return result
+
+
+def evaluate_bundles_batch(
+    bundle_path: Path,
+    task_paths: list[Path],
+    cli_command: str,
+    log_dir: Path,
+    timeout_seconds: int,
+    run_labels: list[str] | None = None,
+    max_workers: int | None = None,
+) -> list[EvaluationResult]:
+    """
+    Evaluate one candidate bundle against many tasks on a thread pool.
+
+    Each evaluation blocks on a CLI subprocess, so threads are the right
+    concurrency primitive here — the GIL is released while waiting on the
+    child. Results come back in task order.
+    """
+    if run_labels is not None and len(run_labels) != len(task_paths):
+        raise ValueError("run_labels must match task_paths length")
+
+    labels = run_labels or [None] * len(task_paths)
+
+    def _one(task_path: Path, run_label: str | None) -> EvaluationResult:
+        return evaluate_bundle(
+            bundle_path=bundle_path,
+            task_path=task_path,
+            cli_command=cli_command,
+            log_dir=log_dir,
+            timeout_seconds=timeout_seconds,
+            run_label=run_label,
+        )
+
+    if len(task_paths) <= 1:
+        return [_one(task_path, label) for task_path, label in zip(task_paths, labels)]
+
+    workers = min(max_workers or (os.cpu_count() or 1), len(task_paths))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="promptopt-eval") as pool:
+        return list(pool.map(_one, task_paths, labels))
+
+
+async def _run_eval_once_async(
+    cmd: list[str],
+    label: str,
+    candidate_id: str,
+    task_id: str,
+    attempt: int,
+    out_dir: Path,
+    timeout_seconds: int,
+) -> int:
+    key = f"{candidate_id}:{task_id}:attempt{attempt}"
+    started_at_utc = utc_timestamp()
+    emit_status_event(
+        "eval_started",
+        summary=f"eval run={label} candidate={candidate_id} started",
+        run_label=label,
+        candidate_id=candidate_id,
+        task_id=task_id,
+        attempt=attempt,
+        out_dir=str(out_dir),
+        key=key,
+        status="running",
+        started_at_utc=started_at_utc,
+        elapsed_seconds=0,
+    )
+    with _open_child_logs(out_dir) as (stdout_log, stderr_log):
+        process = await asyncio.create_subprocess_exec(
+            *cmd, stdout=stdout_log, stderr=stderr_log, start_new_session=True
+        )
+    started = time.monotonic()
+    waiter = asyncio.ensure_future(process.wait())
+
+    while True:
+        elapsed = time.monotonic() - started
+        remaining = timeout_seconds - elapsed
+        if remaining <= 0:
+            waiter.cancel()
+            try:
+                os.killpg(process.pid, signal.SIGKILL)
+            except (AttributeError, OSError):
+                process.kill()
+            await process.wait()
+            emit_status_event(
+                "eval_timeout",
+                summary=f"eval run={label} timeout after {timeout_seconds}s",
                 run_label=label,
                 candidate_id=candidate_id,
                 task_id=task_id,
-                attempt=2,
+                attempt=attempt,
                 out_dir=str(out_dir),
-                key=_event_key(2),
-                passed=False,
-                score=0.0,
-                returncode=None,
+                key=key,
+                timeout_seconds=timeout_seconds,
+                retry=attempt == 1,
             )
-            return EvaluationResult(passed=False, score=0.0)
+            raise subprocess.TimeoutExpired(cmd=cmd, timeout=timeout_seconds)
 
-    evaluator_json = out_dir / "evaluator.json"
+        done, _ = await asyncio.wait({waiter}, timeout=min(HEARTBEAT_SECONDS, remaining))
+        if done:
+            return waiter.result()
 
-    if returncode != 0 and not evaluator_json.exists():
         emit_status_event(
-            "eval_finished",
-            summary=f"eval run={label} pass=False score=0.0",
+            "eval_heartbeat",
+            summary=f"eval run={label} elapsed={int(time.monotonic() - started)}s",
             run_label=label,
             candidate_id=candidate_id,
             task_id=task_id,
-            attempt=attempt_used,
+            attempt=attempt,
             out_dir=str(out_dir),
-            key=_event_key(attempt_used),
-            passed=False,
-            score=0.0,
-            returncode=returncode,
+            key=key,
+            elapsed_seconds=int(time.monotonic() - started),
+            status="running",
+        )
+
+
+async def evaluate_bundle_async(
+    bundle_path: Path,
+    task_path: Path,
+    cli_command: str,
+    log_dir: Path,
+    timeout_seconds: int,
+    run_label: str | None = None,
+) -> EvaluationResult:
+    """
+    Async variant of evaluate_bundle built on asyncio.create_subprocess_exec.
+
+    Mirrors the sync retry semantics (retry once on timeout, retry once when the
+    CLI exits non-zero without writing evaluator.json) so a minibatch of tasks
+    can fan out concurrently instead of waiting on one child at a time.
+    """
+    cmd, label, candidate_id, task_id, out_dir = _prepare_eval(
+        bundle_path, task_path, cli_command, log_dir, run_label
+    )
+
+    def _event_key(attempt: int) -> str:
+        return f"{candidate_id}:{task_id}:attempt{attempt}"
+
+    async def _run(attempt: int, attempt_timeout: int) -> int:
+        return await _run_eval_once_async(
+            cmd, label, candidate_id, task_id, attempt, out_dir, attempt_timeout
+        )
+
+    try:
+        returncode = await _run(attempt=1, attempt_timeout=timeout_seconds)
+        attempt_used = 1
+    except subprocess.TimeoutExpired:
+        try:
+            # Same halved retry budget as the sync path: worst case 1.5x
+            # timeout instead of 2x.
+            returncode = await _run(attempt=2, attempt_timeout=timeout_seconds // 2)
+            attempt_used = 2
+        except subprocess.TimeoutExpired:
+            _emit_eval_finished(label, candidate_id, task_id, 2, out_dir, _event_key(2), False, 0.0, None)
+            return EvaluationResult(passed=False, score=0.0)
+
+    evaluator_json = out_dir / "evaluator.json"
+
+    if returncode != 0 and not evaluator_json.exists():
+        _emit_eval_finished(
+            label, candidate_id, task_id, attempt_used, out_dir, _event_key(attempt_used), False, 0.0, returncode
         )
         try:
             emit_status_event(
@@ -216,42 +513,64 @@ def evaluate_bundle(
                 summary=f"warning: eval run={label} exited {returncode}; retrying because evaluator.json is missing",
                 message=f"eval run={label} exited {returncode}; retrying because evaluator.json is missing",
             )
-            returncode = run_eval_once(attempt=attempt_used + 1)
+            returncode = await _run(attempt=attempt_used + 1, attempt_timeout=timeout_seconds)
             attempt_used += 1
         except subprocess.TimeoutExpired:
-            emit_status_event(
-                "eval_finished",
-                summary=f"eval run={label} pass=False score=0.0",
-                run_label=label,
-                candidate_id=candidate_id,
-                task_id=task_id,
-                attempt=attempt_used,
-                out_dir=str(out_dir),
-                key=_event_key(attempt_used),
-                passed=False,
-                score=0.0,
-                returncode=None,
+            _emit_eval_finished(
+                label, candidate_id, task_id, attempt_used, out_dir, _event_key(attempt_used), False, 0.0, None
             )
             return EvaluationResult(passed=False, score=0.0)
 
-    result = EvaluationResult(passed=False, score=0.0)
-    if evaluator_json.exists():
-        try:
-            result = parse_evaluator_json(evaluator_json)
-        except (json.JSONDecodeError, ValueError):
-            result = EvaluationResult(passed=False, score=0.0)
-
-    emit_status_event(
-        "eval_finished",
-        summary=f"eval run={label} pass={result.passed} score={result.score}",
-        run_label=label,
-        candidate_id=candidate_id,
-        task_id=task_id,
-        attempt=attempt_used,
-        out_dir=str(out_dir),
-        key=_event_key(attempt_used),
-        passed=result.passed,
-        score=result.score,
-        returncode=returncode,
+    result = _load_result(out_dir)
+    _emit_eval_finished(
+        label,
+        candidate_id,
+        task_id,
+        attempt_used,
+        out_dir,
+        _event_key(attempt_used),
+        result.passed,
+        result.score,
+        returncode,
     )
     return result
+
+
+async def evaluate_bundles_async(
+    bundle_path: Path,
+    task_paths: list[Path],
+    cli_command: str,
+    log_dir: Path,
+    timeout_seconds: int,
+    run_labels: list[str] | None = None,
+    max_concurrency: int | None = None,
+) -> list[EvaluationResult]:
+    """
+    Evaluate one candidate bundle against many tasks concurrently.
+
+    Concurrency is bounded by a semaphore so a large minibatch cannot fork an
+    unbounded number of CLI children at once.
+    """
+    if run_labels is not None and len(run_labels) != len(task_paths):
+        raise ValueError("run_labels must match task_paths length")
+
+    limit = max_concurrency or (os.cpu_count() or 1) * 2
+    sem = asyncio.Semaphore(limit)
+
+    async def _bounded(task_path: Path, run_label: str | None) -> EvaluationResult:
+        async with sem:
+            return await evaluate_bundle_async(
+                bundle_path=bundle_path,
+                task_path=task_path,
+                cli_command=cli_command,
+                log_dir=log_dir,
+                timeout_seconds=timeout_seconds,
+                run_label=run_label,
+            )
+
+    labels = run_labels or [None] * len(task_paths)
+    return list(
+        await asyncio.gather(
+            *[_bounded(task_path, label) for task_path, label in zip(task_paths, labels)]
+        )
+    )
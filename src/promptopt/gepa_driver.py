@@ -1,11 +1,17 @@
-import hashlib
-import json
-import time
+import os
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
-from promptopt.bundle_store import build_bundle_from_seed, load_bundle, write_bundle
-from promptopt.evaluator_client import evaluate_bundle as _evaluate_bundle
-from promptopt.run_store import load_run_artifact
+from promptopt import jsonio
+from promptopt.bundle_store import (
+    build_bundle_from_seed,
+    load_bundle,
+    new_content_digest,
+    write_bundle,
+)
 
 
 def load_split(split_file_path):
@@ -13,16 +19,22 @@ def load_split(split_file_path):
     Returns ordered list of task directories from train.txt/val.txt.
     """
     path = Path(split_file_path)
-    if not path.exists():
-        raise FileNotFoundError(f"Split file not found: {split_file_path}")
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except OSError:
+        raise FileNotFoundError(f"Split file not found: {split_file_path}") from None
 
-    tasks = []
-    with open(path, "r") as f:
-        for line in f:
-            line = line.strip()
-            if line:
-                tasks.append(line)
-    return tasks
+    # One stat replaces the read+parse once warm; editing the file
+    # invalidates the cache via the mtime key. Hand back a copy so callers
+    # can mutate their list without poisoning the cache.
+    return list(_load_split_cached(str(path), mtime_ns))
+
+
+@lru_cache(maxsize=32)
+def _load_split_cached(path_str, mtime_ns):
+    with open(path_str, "r", encoding="utf-8") as handle:
+        text = handle.read()
+    return [stripped for line in text.splitlines() if (stripped := line.strip())]
 
 
 def create_candidate_bundle(
@@ -46,12 +58,12 @@ def create_candidate_bundle(
     if seed_bundle_path is None:
         raise ValueError("seed_bundle_path is required")
 
-    seed_path = Path(seed_bundle_path)
+    seed_path = seed_bundle_path if isinstance(seed_bundle_path, Path) else Path(seed_bundle_path)
     if seed_path.exists():
         seed_bundle = load_bundle(seed_path)
         updated_bundle = build_bundle_from_seed(seed_bundle, practices_content)
         bundle = write_bundle(
-            bundle_root=Path(bundle_root),
+            bundle_root=bundle_root if isinstance(bundle_root, Path) else Path(bundle_root),
             bundle=updated_bundle,
             parent_id=seed_bundle.bundle_id,
             generation=str(generation),
@@ -60,35 +72,109 @@ def create_candidate_bundle(
         return bundle.bundle_id, bundle.path, bundle.meta
 
     # Fallback: behave like legacy mode when no seed bundle exists.
-    bundle_root = Path(bundle_root)
+    practices_content = practices_content or {}
+    if not isinstance(bundle_root, Path):
+        bundle_root = Path(bundle_root)
     content_hash = bundle_hash_for_practices(practices_content)
     bundle_id = f"gen{generation}_{content_hash[:8]}"
     bundle_path = bundle_root / bundle_id
-    if bundle_path.exists() and not exist_ok:
-        raise FileExistsError(f"Bundle directory already exists: {bundle_path}")
-
-    practices_dir = bundle_path / "practices"
-    practices_dir.mkdir(parents=True, exist_ok=True)
-    for filename, content in practices_content.items():
-        (practices_dir / filename).write_text(content)
 
     meta = {
         "id": bundle_id,
         "parent": seed_path.name,
         "generation": generation,
     }
-    (bundle_path / "meta.json").write_text(json.dumps(meta, indent=2))
+
+    if bundle_path.exists():
+        if not exist_ok:
+            raise FileExistsError(f"Bundle directory already exists: {bundle_path}")
+        # Content-addressed id: an existing directory already holds this
+        # exact content, so skip rewriting it.
+        meta_path = bundle_path / "meta.json"
+        if meta_path.exists():
+            try:
+                meta = jsonio.load_path(meta_path)
+            except ValueError:
+                pass
+        return bundle_id, bundle_path, meta
+
+    # Stage all writes in a hidden temp dir, then publish atomically so a
+    # crash mid-write cannot leave a partial bundle behind.
+    bundle_root.mkdir(parents=True, exist_ok=True)
+    staging = Path(tempfile.mkdtemp(dir=bundle_root, prefix=f".{bundle_id}."))
+    try:
+        encoded = []
+        if practices_content:
+            practices_dir = staging / "practices"
+            practices_dir.mkdir(parents=True, exist_ok=True)
+            # One str() resolve, then plain os.path.join: no fresh PurePath
+            # allocation per staged file.
+            practices_root = str(practices_dir)
+            encoded = [
+                (os.path.join(practices_root, filename), content.encode("utf-8"))
+                for filename, content in practices_content.items()
+            ]
+        if len(encoded) > 1:
+            # Many small creates are dominated by per-file syscall latency;
+            # overlapping them on a short-lived pool lets the kernel batch
+            # the work without any platform-specific I/O machinery.
+            with ThreadPoolExecutor(max_workers=min(8, len(encoded))) as pool:
+                list(pool.map(lambda item: _write_file_raw(*item), encoded))
+        else:
+            for target, data in encoded:
+                _write_file_raw(target, data)
+        # dump_bytes produces bytes directly (no str round-trip) and
+        # write_bytes skips the TextIOWrapper.
+        (staging / "meta.json").write_bytes(jsonio.dump_bytes(meta))
+        os.replace(staging, bundle_path)
+    except BaseException:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
     return bundle_id, bundle_path, meta
 
 
+def create_candidate_bundles_batch(items, workers=None):
+    """
+    Create many candidate bundles, one per kwargs dict, in submission order.
+
+    A generation's bundles are independent and mix hashing with small-file
+    I/O, so large batches spread across a process pool; small batches stay
+    serial because pool startup would dominate.
+    """
+    items = list(items)
+    if len(items) < 4:
+        return [create_candidate_bundle(**kwargs) for kwargs in items]
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+        futures = [pool.submit(create_candidate_bundle, **kwargs) for kwargs in items]
+        return [future.result() for future in futures]
+
+
+def _write_file_raw(path, data):
+    """
+    Write pre-encoded bytes via os.open/os.write.
+
+    Skips the TextIOWrapper and buffered-writer layers Path.write_text sets
+    up per file, which dominate when staging many small practice files.
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+
+
 def prepare_replay_task(run_id, runs_root):
     """
     Creates a temporary task directory from a recorded run.
     """
-    run = load_run_artifact(Path(runs_root), run_id)
+    # Imported lazily so split/hash-only flows skip loading the run store.
+    from promptopt.run_store import load_run_artifact
+
+    run = load_run_artifact(runs_root if isinstance(runs_root, Path) else Path(runs_root), run_id)
 
-    temp_dir = Path(f"/tmp/mystro_replay_{run_id}_{int(time.time())}")
-    temp_dir.mkdir(parents=True, exist_ok=True)
+    # mkdtemp creates an unshared directory atomically; a second-resolution
+    # time suffix let concurrent replays of the same run collide.
+    temp_dir = Path(tempfile.mkdtemp(prefix=f"mystro_replay_{run_id}_"))
 
     (temp_dir / "goal.txt").write_text(run.goal)
     (temp_dir / "base_commit.txt").write_text(run.base_commit)
@@ -101,10 +187,15 @@ def _merge_frontmatter_body(original_text, new_body):
     Helper to preserve YAML frontmatter from original_text and append new_body.
     """
     if original_text.startswith("---\n"):
-        parts = original_text.split("---\n", 2)
-        if len(parts) >= 3:
-            frontmatter = parts[1]
-            return f"---\n{frontmatter}---\n\n{new_body}"
+        # find() locates the closing delimiter without split()'s three
+        # substring copies; only the frontmatter slice is materialized.
+        # str.find runs the same C-level two-way/memchr search as bytes.find
+        # for ASCII-kind strings, so re-encoding to bytes here would just add
+        # a full copy of the body. Callers holding raw bytes go through
+        # bundle_store._parse_frontmatter, which is bytes-native already.
+        end = original_text.find("\n---\n", 3)
+        if end != -1:
+            return f"---\n{original_text[4:end]}\n---\n\n{new_body}"
     return new_body
 
 
@@ -113,17 +204,66 @@ def evaluate_bundle(bundle_path, task_path, cli_command, log_dir, timeout_second
     Evaluates a bundle against a task using the CLI.
     Returns (pass: bool, score: float).
     """
+    # Imported lazily so split/hash-only flows skip the evaluator subsystem.
+    from promptopt.evaluator_client import evaluate_bundle as _evaluate_bundle
+
+    # The client accepts str | PathLike directly, so no Path re-wrapping.
     result = _evaluate_bundle(
-        bundle_path=Path(bundle_path),
-        task_path=Path(task_path),
+        bundle_path=bundle_path,
+        task_path=task_path,
         cli_command=cli_command,
-        log_dir=Path(log_dir),
+        log_dir=log_dir,
         timeout_seconds=timeout_seconds,
     )
     return result.passed, result.score
 
 
 def bundle_hash_for_practices(practices_content):
-    sorted_content = sorted(practices_content.items())
-    content_str = "".join([content for _, content in sorted_content])
-    return hashlib.sha256(content_str.encode("utf-8")).hexdigest()
+    return _hash_for_items(tuple(sorted(practices_content.items())))
+
+
+def bundle_hash_for_sorted_items(items):
+    """Hash pre-sorted (name, content) pairs, skipping the sort."""
+    return _hash_for_items(tuple(items))
+
+
+@lru_cache(maxsize=1024)
+def _encoded_body(content):
+    """
+    Cached UTF-8 encode of a practice body.
+
+    Across generations most candidates share all but one or two bodies, so
+    the bytes copy per body is paid once; the hasher then streams the cached
+    buffer while encode stays off the repeat path.
+    """
+    return content.encode("utf-8")
+
+
+@lru_cache(maxsize=256)
+def _hash_for_items(items):
+    # Stream name + content through the hasher with NUL separators: no
+    # concatenated copy of the bundle, and no collisions from file-boundary
+    # ambiguity between different filename/content groupings. The lru_cache
+    # skips rehashing when GEPA proposes the same candidate twice.
+    digest = new_content_digest()
+    for name, content in items:
+        digest.update(name.encode("utf-8"))
+        digest.update(b"\x00")
+        digest.update(_encoded_body(content))
+        digest.update(b"\x00")
+    return digest.hexdigest()
+
+
+def bundle_hashes_batch(practices_contents):
+    """
+    Hash many candidate practice dicts at once, preserving input order.
+
+    hashlib releases the GIL while digesting buffers above ~2 KiB, so a small
+    thread pool runs the per-bundle hash loops on separate cores when a whole
+    generation of candidates is hashed together.
+    """
+    items = list(practices_contents)
+    if len(items) <= 1:
+        return [bundle_hash_for_practices(content) for content in items]
+    with ThreadPoolExecutor(max_workers=min(8, len(items))) as pool:
+        return list(pool.map(bundle_hash_for_practices, items))
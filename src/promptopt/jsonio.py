@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson installed
+    orjson = None
+
+
+def loads(data: bytes | str) -> Any:
+    """Decode JSON, via orjson's C parser when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def load_path(path: Path) -> Any:
+    """Read and decode a JSON file as bytes, skipping the text-decode step."""
+    return loads(path.read_bytes())
+
+
+def dump_bytes(payload: Any) -> bytes:
+    """
+    Serialize metadata JSON for disk.
+
+    Compact output by default — these files are only read by machines on hot
+    paths. Set PROMPTOPT_PRETTY=1 for indented output when inspecting by hand.
+    """
+    if os.getenv("PROMPTOPT_PRETTY"):
+        if orjson is not None:
+            return orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+        return json.dumps(payload, indent=2).encode("utf-8")
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, separators=(",", ":")).encode("utf-8")
+
+
+def dumps_pretty(payload: Any) -> str:
+    """
+    Indented, key-sorted JSON for human-facing artifacts.
+
+    Unserializable values are stringified via default=str; raises TypeError
+    only when even that fails. Uses orjson's C encoder when available.
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            payload,
+            default=str,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+        ).decode("utf-8")
+    return json.dumps(payload, indent=2, sort_keys=True, default=str)
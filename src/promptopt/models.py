@@ -1,27 +1,60 @@
 from __future__ import annotations
 
+import hashlib
+import math
+import operator
+import sys
 from dataclasses import dataclass, field
+from functools import cached_property
 from pathlib import Path
 from typing import Any
 
 
 @dataclass
 class PracticeFile:
-    """In-memory representation of a single practice markdown file."""
+    """
+    In-memory representation of a single practice markdown file.
+
+    Stays dict-backed (no slots): the cached_property digests below need an
+    instance __dict__ to store their computed values.
+    """
     file_name: str
     name: str
     frontmatter: str
     body: str
     path: Path | None = None
 
+    def __post_init__(self):
+        # The same few filenames/names recur on thousands of instances per
+        # run; interning collapses them to shared strings that also compare
+        # by pointer when used as dict keys.
+        self.file_name = sys.intern(self.file_name)
+        self.name = sys.intern(self.name)
+
+    @cached_property
+    def body_digest(self) -> bytes:
+        """Digest of the body, computed once per instance for bundle hashing."""
+        return hashlib.sha256(self.body.encode("utf-8")).digest()
+
     def render(self) -> str:
         frontmatter = self.frontmatter.strip()
         if frontmatter:
             return f"---\n{frontmatter}\n---\n\n{self.body}"
         return self.body
 
+    @cached_property
+    def rendered_bytes(self) -> bytes:
+        """
+        Pre-encoded render(), cached per instance.
 
-@dataclass
+        Practices are never mutated after construction, so write_bundle can
+        dump this blob directly instead of re-concatenating and re-encoding
+        the same frontmatter + body on every generation.
+        """
+        return self.render().encode("utf-8")
+
+
+@dataclass(slots=True)
 class Bundle:
     """A bundle is a collection of practices + metadata on disk."""
     bundle_id: str
@@ -30,8 +63,11 @@ class Bundle:
     passthrough_files: dict[str, str] = field(default_factory=dict)
     meta: dict[str, Any] = field(default_factory=dict)
 
+    def __post_init__(self):
+        self.bundle_id = sys.intern(self.bundle_id)
 
-@dataclass
+
+@dataclass(slots=True)
 class RunArtifact:
     """Recorded run used as training data for GEPA."""
     run_id: str
@@ -48,25 +84,39 @@ class RunArtifact:
     dotnet_build_error: str | None = None
     evaluator: dict[str, Any] | None = None
 
+    def __post_init__(self):
+        self.run_id = sys.intern(self.run_id)
+        if self.bundle_id is not None:
+            self.bundle_id = sys.intern(self.bundle_id)
 
-@dataclass
+
+# Shared immutable default for sequence fields: result objects loaded from
+# disk are read-only, so empty ones can all point at the one tuple instead of
+# allocating a fresh list per instance (JSON encoders emit it as []).
+_EMPTY: tuple = ()
+
+
+@dataclass(slots=True)
 class PracticeAttribution:
     """Evaluator notes scoped to specific practices."""
-    selected_practices: list[str] = field(default_factory=list)
-    offending_practices: list[str] = field(default_factory=list)
+    selected_practices: list[str] = field(default=_EMPTY)
+    offending_practices: list[str] = field(default=_EMPTY)
     notes_by_practice: dict[str, list[str]] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class EvaluationResult:
     """Result of evaluating a bundle on a run."""
     passed: bool
     score: float
-    flags: list[str] = field(default_factory=list)
-    notes: list[str] = field(default_factory=list)
+    flags: list[str] = field(default=_EMPTY)
+    notes: list[str] = field(default=_EMPTY)
     practice_attribution: PracticeAttribution = field(default_factory=PracticeAttribution)
     raw: dict[str, Any] = field(default_factory=dict)
 
+    # to_dict/from_dict are the (stable) JSON boundary for evaluation
+    # artifacts; actual byte encode/decode goes through promptopt.jsonio so
+    # the fast parser is used wherever it is available.
     def to_dict(self) -> dict[str, Any]:
         return {
             "pass": self.passed,
@@ -80,18 +130,34 @@ class EvaluationResult:
             },
         }
 
+    @staticmethod
+    def mean_score(results: "list[EvaluationResult]") -> float:
+        """
+        Average score across a batch of results; 0.0 for an empty batch.
+
+        math.fsum over an attrgetter map keeps the whole reduction in C and
+        avoids the float error accumulation of naive summation on large
+        batches.
+        """
+        if not results:
+            return 0.0
+        return math.fsum(map(operator.attrgetter("score"), results)) / len(results)
+
     @staticmethod
     def from_dict(data: dict[str, Any]) -> "EvaluationResult":
+        # The JSON decoder already hands back fresh lists/dicts, so adopt
+        # them directly instead of copying; bool/float stay as the type
+        # boundary for loosely-typed evaluator output.
         practice = data.get("practice_attribution") or {}
         return EvaluationResult(
             passed=bool(data.get("pass", False)),
             score=float(data.get("score", 0.0)),
-            flags=list(data.get("flags") or []),
-            notes=list(data.get("notes") or []),
+            flags=data.get("flags") or _EMPTY,
+            notes=data.get("notes") or _EMPTY,
             practice_attribution=PracticeAttribution(
-                selected_practices=list(practice.get("selected_practices") or []),
-                offending_practices=list(practice.get("offending_practices") or []),
-                notes_by_practice=dict(practice.get("notes_by_practice") or {}),
+                selected_practices=practice.get("selected_practices") or _EMPTY,
+                offending_practices=practice.get("offending_practices") or _EMPTY,
+                notes_by_practice=practice.get("notes_by_practice") or {},
             ),
             raw=data,
         )
@@ -1,13 +1,14 @@
 import os
-import json
+import re
 import shutil
 import sys
 import tempfile
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterable, Any
+from typing import Iterable, Any, Sequence
 
 import typer
 import dspy
@@ -18,6 +19,7 @@ from dspy.utils import DummyLM
 from dspy.utils.callback import BaseCallback
 from dotenv import load_dotenv
 
+from promptopt import jsonio
 from promptopt.bundle_store import (
     ensure_active_bundle,
     load_bundle,
@@ -25,9 +27,11 @@ from promptopt.bundle_store import (
     write_bundle,
     update_active_json,
     hash_bundle,
+    new_content_digest,
 )
 from promptopt.cache import EvaluationCache
 from promptopt.evaluator_client import evaluate_bundle
+from promptopt.executors import EvalExecutorKind, SerialExecutor, build_executor
 from promptopt.gepa_runtime import compile_gepa_with_status
 from promptopt.gepa_driver import load_split
 from promptopt.models import Bundle, EvaluationResult, PracticeFile, RunArtifact
@@ -39,8 +43,8 @@ from promptopt.status import (
     PromptOptUiMode,
     emit_status_event,
     set_current_status_sink,
+    utc_timestamp,
 )
-from promptopt.ui import LivePromptOptStatusSink
 
 # Load env automatically (finds .env in root)
 load_dotenv()
@@ -50,10 +54,19 @@ app = typer.Typer()
 REFLECTION_TRANSCRIPT_ENABLED = True
 EVAL_HEARTBEAT_SECONDS = 15
 TRANSCRIPT_PREVIEW_LIMIT = 240
+# Opt-in plateau early stopping: set PROMPTOPT_EARLY_STOP_PATIENCE=N to stop
+# re-evaluating a training batch once its best score has not improved for N
+# rollouts. Disabled by default (0) because a stopped batch answers with its
+# best earlier prediction instead of evaluating the new candidate.
+EARLY_STOP_PATIENCE = 0
+EARLY_STOP_EPS = 0.0
 
 
 def _utc_timestamp() -> str:
-    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+    # Delegates to the status module's per-second cached formatter; transcript
+    # and artifact stamps only need second precision, and the bursts of calls
+    # around each reflection event all land in the same cached second.
+    return utc_timestamp()
 
 
 def _resolve_ui_mode(requested_ui: PromptOptUiMode | None) -> PromptOptUiMode:
@@ -67,28 +80,50 @@ def _resolve_ui_mode(requested_ui: PromptOptUiMode | None) -> PromptOptUiMode:
 def _build_status_sink(ui_mode: PromptOptUiMode, logs_root: Path) -> tuple[CompositePromptOptStatusSink, Path]:
     events_path = logs_root / "events.jsonl"
     journal_sink = JsonlPromptOptStatusSink(events_path)
-    screen_sink = LivePromptOptStatusSink() if ui_mode == PromptOptUiMode.LIVE else PlainPromptOptStatusSink()
+    if ui_mode == PromptOptUiMode.LIVE:
+        # Imported lazily: the live dashboard pulls in rich, which plain-mode
+        # runs (CI, piped output) never need.
+        from promptopt.ui import LivePromptOptStatusSink
+
+        screen_sink = LivePromptOptStatusSink()
+    else:
+        screen_sink = PlainPromptOptStatusSink()
     return CompositePromptOptStatusSink(screen_sink, journal_sink), events_path
 
 
+# Maps both newline flavours to a literal "\n" in one translate pass; the
+# CRLF pair is collapsed first so it becomes one marker, not two.
+_NL_TABLE = str.maketrans({"\r": "\\n", "\n": "\\n"})
+
+
 def _compact_single_line(text: str | None, limit: int = TRANSCRIPT_PREVIEW_LIMIT) -> str:
     if not text:
         return "(none)"
-    compact = (
-        str(text)
-        .replace("\r\n", "\n")
-        .replace("\r", "\n")
-        .replace("\n", "\\n")
-        .strip()
-    )
+    compact = str(text).replace("\r\n", "\n").translate(_NL_TABLE).strip()
     if len(compact) <= limit:
         return compact
     return f"{compact[:limit]}...(truncated)"
 
 
 def _safe_json(value: Any) -> str:
+    # Hashable payloads (prompt strings, shared tuples) repeat heavily across
+    # reflection calls, so their rendered JSON is memoized by value; lists
+    # and dicts fall through to a direct render — fingerprinting those would
+    # cost a serialization pass anyway.
+    try:
+        return _safe_json_cached(value)
+    except TypeError:
+        pass
+    try:
+        return jsonio.dumps_pretty(value)
+    except TypeError:
+        return str(value)
+
+
+@lru_cache(maxsize=256)
+def _safe_json_cached(value: Any) -> str:
     try:
-        return json.dumps(value, indent=2, sort_keys=True, default=str)
+        return jsonio.dumps_pretty(value)
     except TypeError:
         return str(value)
 
@@ -134,6 +169,11 @@ class ReflectionTranscriptEvent:
     prompt: str | None
     messages: Any
     kwargs: dict[str, Any]
+    # Serialized forms are computed once at record time (while the payloads
+    # are small and local) so write_markdown only concatenates strings.
+    messages_json: str = "null"
+    kwargs_json: str = "{}"
+    outputs_text: str = "(none)"
     ended_at_utc: str | None = None
     duration_ms: int | None = None
     outputs: Any = None
@@ -141,11 +181,29 @@ class ReflectionTranscriptEvent:
 
 
 class ReflectionTranscriptRecorder:
-    def __init__(self, enabled: bool = True):
+    def __init__(self, enabled: bool = True, raw_events_path: Path | None = None):
         self.enabled = enabled
         self._events: list[ReflectionTranscriptEvent] = []
         self._event_index_by_call_id: dict[str, int] = {}
         self._started_monotonic_by_call_id: dict[str, float] = {}
+        # Optional append-as-you-go journal of raw events: compact JSON, one
+        # line per record, written as each call starts/ends. Cheap to append
+        # and to re-parse for analysis, unlike the pretty Markdown artifact.
+        self._raw_events_path = raw_events_path
+        self._raw_events_log = None
+
+    def _append_raw_event(self, record: dict[str, Any]) -> None:
+        if self._raw_events_path is None:
+            return
+        if self._raw_events_log is None:
+            self._raw_events_path.parent.mkdir(parents=True, exist_ok=True)
+            self._raw_events_log = open(self._raw_events_path, "ab")
+        self._raw_events_log.write(jsonio.dump_bytes(record) + b"\n")
+
+    def close(self) -> None:
+        if self._raw_events_log is not None:
+            self._raw_events_log.close()
+            self._raw_events_log = None
 
     def start(self, call_id: str, prompt: Any, messages: Any, kwargs: Any) -> None:
         if not self.enabled:
@@ -159,6 +217,17 @@ class ReflectionTranscriptRecorder:
             messages=messages,
             kwargs=dict(kwargs or {}),
         )
+        event.messages_json = _safe_json(event.messages)
+        event.kwargs_json = _safe_json(event.kwargs)
+        self._append_raw_event({
+            "event": "reflection_start",
+            "index": event.index,
+            "call_id": event.call_id,
+            "started_at_utc": event.started_at_utc,
+            "prompt": event.prompt,
+            "messages_json": event.messages_json,
+            "kwargs_json": event.kwargs_json,
+        })
         self._events.append(event)
         self._event_index_by_call_id[call_id] = len(self._events) - 1
         self._started_monotonic_by_call_id[call_id] = time.monotonic()
@@ -193,6 +262,16 @@ class ReflectionTranscriptRecorder:
             event.exception = f"{type(exception).__name__}: {exception}"
 
         output_text = _stringify_outputs(outputs)
+        event.outputs_text = output_text
+        self._append_raw_event({
+            "event": "reflection_end",
+            "index": event.index,
+            "call_id": event.call_id,
+            "ended_at_utc": event.ended_at_utc,
+            "duration_ms": duration_ms,
+            "outputs_text": output_text,
+            "exception": event.exception,
+        })
         emit_status_event(
             "reflection_output",
             summary=f"reflection output call={event.index}",
@@ -214,55 +293,60 @@ class ReflectionTranscriptRecorder:
             return
 
         path.parent.mkdir(parents=True, exist_ok=True)
-        lines = [
-            "# Reflection LM Transcript",
-            "",
-            f"captured_at_utc: {_utc_timestamp()}",
-            f"calls: {len(self._events)}",
-            "",
-        ]
-
-        for event in self._events:
-            lines.extend([
-                f"## Call {event.index}",
-                "",
-                f"call_id: {event.call_id}",
-                f"started_at_utc: {event.started_at_utc}",
-                f"ended_at_utc: {event.ended_at_utc or '(none)'}",
-                f"duration_ms: {event.duration_ms if event.duration_ms is not None else '(none)'}",
-                "",
-                "### Prompt",
-                "",
-            ])
-            _append_block(lines, "text", event.prompt or "")
-            lines.extend([
-                "",
-                "### Messages",
-                "",
-            ])
-            _append_block(lines, "json", _safe_json(event.messages))
-            lines.extend([
-                "",
-                "### Kwargs",
-                "",
-            ])
-            _append_block(lines, "json", _safe_json(event.kwargs))
-            lines.extend([
-                "",
-                "### Output",
-                "",
-            ])
-            _append_block(lines, "text", _stringify_outputs(event.outputs))
-            if event.exception:
+        # Stream one section at a time through the buffered handle: peak
+        # memory stays at a single call's worth of text instead of the
+        # whole transcript joined into one giant string.
+        with open(path, "w", encoding="utf-8") as handle:
+            handle.write(
+                "\n".join([
+                    "# Reflection LM Transcript",
+                    "",
+                    f"captured_at_utc: {_utc_timestamp()}",
+                    f"calls: {len(self._events)}",
+                    "",
+                ])
+            )
+            for event in self._events:
+                lines = [
+                    f"## Call {event.index}",
+                    "",
+                    f"call_id: {event.call_id}",
+                    f"started_at_utc: {event.started_at_utc}",
+                    f"ended_at_utc: {event.ended_at_utc or '(none)'}",
+                    f"duration_ms: {event.duration_ms if event.duration_ms is not None else '(none)'}",
+                    "",
+                    "### Prompt",
+                    "",
+                ]
+                _append_block(lines, "text", event.prompt or "")
                 lines.extend([
                     "",
-                    "### Exception",
+                    "### Messages",
                     "",
                 ])
-                _append_block(lines, "text", event.exception)
-            lines.append("")
-
-        path.write_text("\n".join(lines))
+                _append_block(lines, "json", event.messages_json)
+                lines.extend([
+                    "",
+                    "### Kwargs",
+                    "",
+                ])
+                _append_block(lines, "json", event.kwargs_json)
+                lines.extend([
+                    "",
+                    "### Output",
+                    "",
+                ])
+                _append_block(lines, "text", event.outputs_text)
+                if event.exception:
+                    lines.extend([
+                        "",
+                        "### Exception",
+                        "",
+                    ])
+                    _append_block(lines, "text", event.exception)
+                lines.append("")
+                handle.write("\n")
+                handle.write("\n".join(lines))
         emit_status_event(
             "artifact_ready",
             summary=f"reflection transcript written {path}",
@@ -275,6 +359,16 @@ class ReflectionTranscriptRecorder:
 class ReflectionLMTranscriptCallback(BaseCallback):
     def __init__(self, recorder: ReflectionTranscriptRecorder):
         self._recorder = recorder
+        if not recorder.enabled:
+            # Shadow the hooks with instance-level no-ops so a disabled
+            # recorder costs nothing per LM call — the dispatcher finds the
+            # no-op before the class methods and skips the inputs unpacking.
+            self.on_lm_start = self._noop
+            self.on_lm_end = self._noop
+
+    @staticmethod
+    def _noop(*args: Any, **kwargs: Any) -> None:
+        return None
 
     def on_lm_start(
         self,
@@ -312,6 +406,10 @@ class PracticeSignature(dspy.Signature):
     response: str = dspy.OutputField(desc="No-op response")
 
 
+# One C-level scan for ADD_LINE payloads; no per-line list from splitlines().
+_ADD_LINE_RE = re.compile(r"ADD_LINE:[ \t]*([^\r\n]+)")
+
+
 class TestReflectionLM:
     """
     Deterministic reflection LM for tests.
@@ -337,17 +435,19 @@ class TestReflectionLM:
 
         try:
             current_instruction = _extract_first_code_block(prompt)
-            add_lines = []
-            for line in prompt.splitlines():
-                if "ADD_LINE:" in line:
-                    _, payload = line.split("ADD_LINE:", 1)
-                    payload = payload.strip()
-                    if payload:
-                        add_lines.append(payload)
+            add_lines = [
+                payload
+                for match in _ADD_LINE_RE.finditer(prompt)
+                if (payload := match.group(1).strip())
+            ]
 
+            # Exact-line membership via a set: one pass over the instruction
+            # instead of a substring scan of the growing text per payload.
             updated = current_instruction
+            existing_lines = {line.strip() for line in current_instruction.splitlines()}
             for payload in add_lines:
-                if payload not in updated:
+                if payload not in existing_lines:
+                    existing_lines.add(payload)
                     updated = updated.rstrip() + "\n" + payload
 
             result = [f"```\n{updated.strip()}\n```"]
@@ -372,6 +472,7 @@ class BundleProgram(dspy.Module):
         cache: EvaluationCache,
         cli_command: str,
         timeout: int,
+        executor=None,
     ):
         super().__init__()
         self.seed_bundle = seed_bundle
@@ -381,6 +482,7 @@ class BundleProgram(dspy.Module):
         self.cache = cache
         self.cli_command = cli_command
         self.timeout = timeout
+        self.executor = executor if executor is not None else SerialExecutor()
 
         # Map predictor name -> PracticeFile for later feedback attribution.
         self.practice_by_pred: dict[str, PracticeFile] = {}
@@ -390,6 +492,39 @@ class BundleProgram(dspy.Module):
         }
         self._mutable_files: set[str] = set(seed_bundle.practices.keys())
         self._rollout_index = 0
+        # Materialized candidates by content hash: any rollout revisiting an
+        # already-written candidate (not just the previous one — GEPA's
+        # Pareto selection alternates between a few) skips write_bundle.
+        self._written_by_hash: dict[str, Bundle] = {}
+        # Opt-in plateau detection, tracked per batch key because scores from
+        # different minibatches are not comparable. A plateaued training batch
+        # answers with its own best earlier prediction — trading scoring
+        # fidelity on that batch for replay cost — while exempt batches (the
+        # valset, whose scores drive GEPA's final candidate selection) and
+        # batches not seen before are always evaluated for real.
+        try:
+            self._early_stop_patience = int(
+                os.getenv("PROMPTOPT_EARLY_STOP_PATIENCE", str(EARLY_STOP_PATIENCE))
+            )
+        except ValueError:
+            self._early_stop_patience = EARLY_STOP_PATIENCE
+        self._score_history_by_batch: dict[tuple[str, ...], list[float]] = {}
+        self._best_by_batch: dict[tuple[str, ...], dspy.Prediction] = {}
+        self._stopped_batches: set[tuple[str, ...]] = set()
+        self._early_stop_exempt_batches: set[tuple[str, ...]] = set()
+        # Candidate bundles and their hashes, keyed by the instruction tuple:
+        # GEPA revisits the same candidate on different minibatches, and this
+        # skips rebuilding and rehashing the whole bundle each time.
+        self._candidate_cache: dict[tuple[tuple[str, str], ...], tuple[Bundle, str]] = {}
+        # Replay task dirs, reused across rollouts: run goal/base_commit are
+        # immutable, so one directory per run serves every evaluation.
+        self._task_dir_by_run: dict[str, Path] = {}
+        # Run context strings, keyed by batch ids: built from immutable run
+        # artifact fields, so each unique batch is formatted only once.
+        self._run_context_cache: dict[tuple[str, ...], str] = {}
+        # Per-run formatted sections, shared by every batch containing the
+        # run, so the truncation work happens once per run, not per batch.
+        self._run_section_cache: dict[str, str] = {}
 
         for idx, practice in enumerate(seed_bundle.practices.values()):
             pred_name = f"practice_{idx}"
@@ -405,6 +540,16 @@ class BundleProgram(dspy.Module):
             return [r for r in run_ids.split(",") if r]
         return list(run_ids)
 
+    def exempt_from_early_stop(self, batches: Iterable[Iterable[str] | str]) -> None:
+        """
+        Mark batches that plateau detection must never short-circuit.
+
+        Used for the valset: its scores feed GEPA's candidate selection, so
+        every valset evaluation has to be real no matter how flat it looks.
+        """
+        for batch in batches:
+            self._early_stop_exempt_batches.add(tuple(self._normalize_run_ids(batch)))
+
     def _register_alias(self, alias: str, file_name: str) -> None:
         key = alias.strip().lower()
         if key and key not in self.file_by_alias:
@@ -413,38 +558,34 @@ class BundleProgram(dspy.Module):
     def _resolve_practice_file(self, practice_name: str) -> str | None:
         return self.file_by_alias.get(practice_name.strip().lower())
 
-    def _extract_targeted_files(self, run_id: str, evaluation: EvaluationResult) -> set[str]:
-        attribution = evaluation.practice_attribution
-        attribution_names = list(attribution.notes_by_practice.keys())
-
-        if not attribution_names:
-            emit_status_event(
-                "warning",
-                summary=f"warning: no practice notes for run {run_id}; skipping mutations",
-                message=f"No practice notes for run {run_id}; skipping mutations for this run.",
-                run_id=run_id,
-            )
-            return set()
-
+    def _collect_targeted_files(self, evaluations_by_run: list[tuple[str, EvaluationResult]]) -> set[str]:
+        # One set for the whole batch, filled directly from the attribution
+        # dicts; resolve is a pre-bound dict.get so the inner loop skips the
+        # attribute lookups a helper call per run would add.
         targeted: set[str] = set()
-        for name in attribution_names:
-            resolved = self._resolve_practice_file(name)
-            if resolved:
-                targeted.add(resolved)
-            else:
+        resolve = self.file_by_alias.get
+        for run_id, evaluation in evaluations_by_run:
+            notes_by_practice = evaluation.practice_attribution.notes_by_practice
+            if not notes_by_practice:
                 emit_status_event(
                     "warning",
-                    summary=f"warning: unrecognized practice attribution {name}",
-                    message=f"Unrecognized practice attribution '{name}' for run {run_id}; ignoring.",
+                    summary=f"warning: no practice notes for run {run_id}; skipping mutations",
+                    message=f"No practice notes for run {run_id}; skipping mutations for this run.",
                     run_id=run_id,
-                    practice_name=name,
                 )
-        return targeted
-
-    def _collect_targeted_files(self, evaluations_by_run: list[tuple[str, EvaluationResult]]) -> set[str]:
-        targeted: set[str] = set()
-        for run_id, evaluation in evaluations_by_run:
-            targeted.update(self._extract_targeted_files(run_id, evaluation))
+                continue
+            for name in notes_by_practice:
+                resolved = resolve(name.strip().lower())
+                if resolved:
+                    targeted.add(resolved)
+                else:
+                    emit_status_event(
+                        "warning",
+                        summary=f"warning: unrecognized practice attribution {name}",
+                        message=f"Unrecognized practice attribution '{name}' for run {run_id}; ignoring.",
+                        run_id=run_id,
+                        practice_name=name,
+                    )
         return targeted
 
     def _current_practice_updates(self) -> dict[str, str]:
@@ -469,6 +610,42 @@ class BundleProgram(dspy.Module):
         self._fixed_updates = dict(fixed_updates)
         self._mutable_files = set(mutable_files)
 
+    def _get_or_build_task_dir(self, run: RunArtifact) -> Path:
+        """
+        Return a reusable task directory for a run, building it at most once.
+
+        Lives under log_dir/tasks/<run_id> rather than a fresh tempdir per
+        evaluation; a .fingerprint file guards against stale content from an
+        earlier process pointing at a different run artifact.
+        """
+        cached = self._task_dir_by_run.get(run.run_id)
+        if cached is not None:
+            return cached
+
+        task_dir = self.log_dir / "tasks" / run.run_id
+        digest = new_content_digest()
+        digest.update(run.goal.encode("utf-8"))
+        digest.update(b"\x00")
+        digest.update(run.base_commit.encode("utf-8"))
+        fingerprint = digest.hexdigest()
+        fingerprint_path = task_dir / ".fingerprint"
+
+        try:
+            fresh = fingerprint_path.read_text() == fingerprint
+        except OSError:
+            fresh = False
+        if not fresh:
+            task_dir.mkdir(parents=True, exist_ok=True)
+            (task_dir / "goal.txt").write_text(run.goal)
+            (task_dir / "base_commit.txt").write_text(run.base_commit)
+            previous_run_result_path = run.run_dir / "run_result.json"
+            if previous_run_result_path.exists():
+                (task_dir / "previous_run_results.json").write_bytes(previous_run_result_path.read_bytes())
+            fingerprint_path.write_text(fingerprint)
+
+        self._task_dir_by_run[run.run_id] = task_dir
+        return task_dir
+
     def _truncate(self, value: str | None, limit: int) -> str:
         if not value:
             return "(none)"
@@ -477,22 +654,35 @@ class BundleProgram(dspy.Module):
             return text
         return f"{text[:limit]}...(truncated)"
 
+    def _run_section(self, run_id: str) -> str:
+        cached = self._run_section_cache.get(run_id)
+        if cached is not None:
+            return cached
+
+        run = self.runs_by_id[run_id]
+        test_signal = run.dotnet_test if run.dotnet_test is not None else run.dotnet_test_error
+        build_signal = run.dotnet_build if run.dotnet_build is not None else run.dotnet_build_error
+        # One flat f-string: no intermediate line list, no inner join.
+        text = (
+            f"run_id: {run.run_id}\n"
+            f"goal:\n{self._truncate(run.goal, self._TEXT_LIMIT)}\n"
+            f"base_commit: {run.base_commit}\n"
+            f"git_diff:\n{self._truncate(run.git_diff, self._TEXT_LIMIT)}\n"
+            f"dotnet_test:\n{self._truncate(test_signal, self._TEXT_LIMIT)}\n"
+            f"dotnet_build:\n{self._truncate(build_signal, self._TEXT_LIMIT)}"
+        )
+        self._run_section_cache[run_id] = text
+        return text
+
     def _build_run_context(self, batch_ids: list[str]) -> str:
-        sections = []
-        for run_id in batch_ids:
-            run = self.runs_by_id[run_id]
-            test_signal = run.dotnet_test if run.dotnet_test is not None else run.dotnet_test_error
-            build_signal = run.dotnet_build if run.dotnet_build is not None else run.dotnet_build_error
-            section = [
-                f"run_id: {run.run_id}",
-                f"goal:\n{self._truncate(run.goal, self._TEXT_LIMIT)}",
-                f"base_commit: {run.base_commit}",
-                f"git_diff:\n{self._truncate(run.git_diff, self._TEXT_LIMIT)}",
-                f"dotnet_test:\n{self._truncate(test_signal, self._TEXT_LIMIT)}",
-                f"dotnet_build:\n{self._truncate(build_signal, self._TEXT_LIMIT)}",
-            ]
-            sections.append("\n".join(section))
-        return "\n\n---\n\n".join(sections)
+        key = tuple(batch_ids)
+        cached = self._run_context_cache.get(key)
+        if cached is not None:
+            return cached
+
+        context = "\n\n---\n\n".join(map(self._run_section, batch_ids))
+        self._run_context_cache[key] = context
+        return context
 
     def forward(self, run_ids: list[str]) -> dspy.Prediction:
         """
@@ -505,22 +695,36 @@ class BundleProgram(dspy.Module):
         if not batch_ids:
             return dspy.Prediction(score=0.0, feedback="No runs provided", feedback_by_pred={})
 
+        batch_key = tuple(batch_ids)
+        if batch_key in self._stopped_batches:
+            return self._best_by_batch[batch_key]
+
         self._rollout_index += 1
 
         # Build a candidate bundle from the latest predictor instructions.
         updates = self._current_practice_updates()
-        candidate_bundle = build_bundle_from_seed(self.seed_bundle, updates)
-        bundle_hash = hash_bundle(candidate_bundle.practices, candidate_bundle.passthrough_files)
-
-        # Persist candidate bundle to disk so the CLI can read it.
-        written_bundle = write_bundle(
-            bundle_root=self.bundle_root,
-            bundle=candidate_bundle,
-            parent_id=self.seed_bundle.bundle_id,
-            generation="gepa",
-            metadata={},
-            exist_ok=True,
-        )
+        candidate_key = tuple(sorted(updates.items()))
+        cached_candidate = self._candidate_cache.get(candidate_key)
+        if cached_candidate is not None:
+            candidate_bundle, bundle_hash = cached_candidate
+        else:
+            candidate_bundle = build_bundle_from_seed(self.seed_bundle, updates)
+            bundle_hash = hash_bundle(candidate_bundle.practices, candidate_bundle.passthrough_files)
+            self._candidate_cache[candidate_key] = (candidate_bundle, bundle_hash)
+
+        # Persist candidate bundle to disk so the CLI can read it, reusing
+        # any earlier materialization of the same content hash.
+        written_bundle = self._written_by_hash.get(bundle_hash)
+        if written_bundle is None:
+            written_bundle = write_bundle(
+                bundle_root=self.bundle_root,
+                bundle=candidate_bundle,
+                parent_id=self.seed_bundle.bundle_id,
+                generation="gepa",
+                metadata={},
+                exist_ok=True,
+            )
+            self._written_by_hash[bundle_hash] = written_bundle
         emit_status_event(
             "gepa_rollout_started",
             phase="evaluation",
@@ -530,9 +734,11 @@ class BundleProgram(dspy.Module):
             run_ids=list(batch_ids),
         )
 
-        evaluations_by_run: list[tuple[str, EvaluationResult]] = []
+        results_by_run: dict[str, EvaluationResult] = {}
+        pending_ids: list[str] = []
+        cached_results = self.cache.get_many(batch_ids, bundle_hash)
         for run_id in batch_ids:
-            cached = self.cache.get(run_id, bundle_hash)
+            cached = cached_results.get(run_id)
             if cached:
                 emit_status_event(
                     "eval_cache_hit",
@@ -542,25 +748,38 @@ class BundleProgram(dspy.Module):
                     task_id=run_id,
                     score=cached.score,
                 )
-                evaluations_by_run.append((run_id, cached))
+                results_by_run[run_id] = cached
                 continue
+            pending_ids.append(run_id)
+
+        if pending_ids:
+            # Cache misses fan out through the configured executor (--executor
+            # thread/process): replays are subprocess-bound and independent,
+            # so batch wall time approaches the slowest run, not the sum.
+            jobs = [
+                _ReplayJob(
+                    bundle_path=written_bundle.path,
+                    run=self.runs_by_id[run_id],
+                    cli_command=self.cli_command,
+                    log_dir=self.log_dir,
+                    timeout_seconds=self.timeout,
+                    run_label=run_id,
+                    task_path=self._get_or_build_task_dir(self.runs_by_id[run_id]),
+                )
+                for run_id in pending_ids
+            ]
+            pending_writes = []
+            for run_id, result in zip(pending_ids, self.executor.map(_evaluate_replay_job, jobs)):
+                pending_writes.append((run_id, bundle_hash, result))
+                results_by_run[run_id] = result
+            self.cache.set_many(pending_writes)
 
-            run = self.runs_by_id[run_id]
-            result = evaluate_run_replay(
-                bundle_path=written_bundle.path,
-                run=run,
-                cli_command=self.cli_command,
-                log_dir=self.log_dir,
-                timeout_seconds=self.timeout,
-                run_label=run_id,
-            )
-            self.cache.set(run_id, bundle_hash, result)
-            evaluations_by_run.append((run_id, result))
+        evaluations_by_run = [(run_id, results_by_run[run_id]) for run_id in batch_ids]
 
         evaluations = [evaluation for _, evaluation in evaluations_by_run]
 
         # Aggregate per-run scores into a single GEPA fitness score.
-        score = sum(e.score for e in evaluations) / max(len(evaluations), 1)
+        score = EvaluationResult.mean_score(evaluations)
         targeted_files = self._collect_targeted_files(evaluations_by_run)
 
         # Route per-practice feedback only for targeted predictors.
@@ -568,12 +787,19 @@ class BundleProgram(dspy.Module):
         attribution_by_run = self._build_attribution_diagnostics(evaluations_by_run)
         overall_feedback = "\n".join(_flatten_notes(evaluations))
 
-        run_context = self._build_run_context(batch_ids)
-        for pred_name, practice in self.practice_by_pred.items():
-            if practice.file_name not in targeted_files:
-                continue
-            predictor = getattr(self, pred_name)
-            predictor(run_context=run_context)
+        # GEPA only needs the targeted predictors to appear in the trace;
+        # append the record Predict's postprocess would have produced instead
+        # of running the full adapter pipeline against the dummy base LM.
+        trace = dspy.settings.trace
+        if trace is not None and dspy.settings.max_trace_size > 0:
+            run_context = self._build_run_context(batch_ids)
+            for pred_name, practice in self.practice_by_pred.items():
+                if practice.file_name not in targeted_files:
+                    continue
+                predictor = getattr(self, pred_name)
+                if len(trace) >= dspy.settings.max_trace_size:
+                    trace.pop(0)
+                trace.append((predictor, {"run_context": run_context}, dspy.Prediction(response="ok")))
 
         for file_name in targeted_files:
             if file_name in updates:
@@ -589,31 +815,75 @@ class BundleProgram(dspy.Module):
             score=score,
         )
 
-        return dspy.Prediction(
+        prediction = dspy.Prediction(
             score=score,
             feedback=overall_feedback,
             feedback_by_pred=feedback_by_pred,
             attribution_by_run=attribution_by_run,
         )
+        self._record_rollout_score(batch_key, score, prediction)
+        return prediction
+
+    def _record_rollout_score(
+        self, batch_key: tuple[str, ...], score: float, prediction: dspy.Prediction
+    ) -> None:
+        if batch_key in self._early_stop_exempt_batches:
+            return
+        history = self._score_history_by_batch.setdefault(batch_key, [])
+        history.append(score)
+        best = self._best_by_batch.get(batch_key)
+        if best is None or score > getattr(best, "score", float("-inf")):
+            self._best_by_batch[batch_key] = prediction
+
+        patience = self._early_stop_patience
+        if patience <= 0 or len(history) <= patience:
+            return
+        # Plateau rule, applied within one batch so only comparable scores
+        # meet: the best of the last `patience` evaluations of this batch
+        # failed to beat the best seen before that window by more than epsilon.
+        if max(history[-patience:]) - max(history[:-patience]) <= EARLY_STOP_EPS:
+            self._stopped_batches.add(batch_key)
+            emit_status_event(
+                "gepa_early_stop",
+                phase="gepa_compile",
+                summary=f"batch plateaued after {len(history)} evaluations (no improvement in {patience})",
+                run_ids=list(batch_key),
+                evaluations=len(history),
+                patience=patience,
+                best_score=getattr(self._best_by_batch[batch_key], "score", score),
+            )
 
     def _build_feedback_map(
         self,
         evaluations_by_run: list[tuple[str, EvaluationResult]],
         targeted_files: set[str],
     ) -> dict[str, str]:
+        # No targeted practices means no predictor receives feedback; skip
+        # the summary/notes assembly entirely instead of building and then
+        # discarding it (preflight rollback and early iterations hit this).
+        if not targeted_files:
+            return {}
+
         notes_by_file: dict[str, list[str]] = {}
         summary_lines: list[str] = []
+        resolved_by_name: dict[str, str | None] = {}
         for run_id, evaluation in evaluations_by_run:
             flags = ", ".join(evaluation.flags) if evaluation.flags else "none"
             notes = " | ".join(evaluation.notes) if evaluation.notes else "none"
+            # Format the run tag once; per-note cost is then one concat fed
+            # straight to extend, with no intermediate list.
+            prefix = f"[run={run_id}] "
             summary_lines.append(
-                f"[run={run_id}] pass={evaluation.passed} score={evaluation.score} flags={flags} notes={notes}"
+                f"{prefix}pass={evaluation.passed} score={evaluation.score} flags={flags} notes={notes}"
             )
             for name, notes_for_practice in evaluation.practice_attribution.notes_by_practice.items():
-                resolved = self._resolve_practice_file(name)
+                if name not in resolved_by_name:
+                    resolved_by_name[name] = self._resolve_practice_file(name)
+                resolved = resolved_by_name[name]
                 if resolved:
-                    prefixed = [f"[run={run_id}] {note}" for note in notes_for_practice]
-                    notes_by_file.setdefault(resolved, []).extend(prefixed)
+                    notes_by_file.setdefault(resolved, []).extend(
+                        prefix + note for note in notes_for_practice
+                    )
 
         feedback_by_pred: dict[str, str] = {}
         for pred_name, practice in self.practice_by_pred.items():
@@ -703,16 +973,22 @@ def select_feedback_targeted_components(
     return [state.list_of_named_predictors[pid]]
 
 
+# Locates the first fenced block in one pass; the lazy body stops at the
+# closing fence without backtracking over the rest of the prompt.
+_FENCE_RE = re.compile(r"```(.*?)```", re.DOTALL)
+
+
 def _extract_first_code_block(prompt: str) -> str:
-    start = prompt.find("```")
-    if start == -1:
-        return prompt.strip()
-    start += 3
-    end = prompt.find("```", start)
-    if end == -1:
-        return prompt[start:].strip()
+    match = _FENCE_RE.search(prompt)
+    if match is None:
+        start = prompt.find("```")
+        if start == -1:
+            return prompt.strip()
+        # Unclosed fence: everything after the opener is the block.
+        block = prompt[start + 3:]
+    else:
+        block = match.group(1)
     # strip optional language specifier
-    block = prompt[start:end]
     if "\n" in block:
         first_line, rest = block.split("\n", 1)
         if first_line.strip() and len(first_line.split()) == 1:
@@ -749,8 +1025,13 @@ def evaluate_run_replay(
     log_dir: Path,
     timeout_seconds: int,
     run_label: str,
+    task_path: Path | None = None,
 ) -> EvaluationResult:
-    task_path = prepare_task_dir(run)
+    # A caller-provided task_path (the pooled per-run dir) is reused across
+    # evaluations and left in place; only self-built tempdirs are removed.
+    owns_task_dir = task_path is None
+    if owns_task_dir:
+        task_path = prepare_task_dir(run)
     try:
         return evaluate_bundle(
             bundle_path=Path(bundle_path),
@@ -761,7 +1042,33 @@ def evaluate_run_replay(
             run_label=run_label,
         )
     finally:
-        _safe_remove_path(task_path)
+        if owns_task_dir:
+            _safe_remove_path(task_path)
+
+
+@dataclass
+class _ReplayJob:
+    """Picklable description of one replay evaluation, for executor workers."""
+
+    bundle_path: Path
+    run: RunArtifact
+    cli_command: str
+    log_dir: Path
+    timeout_seconds: int
+    run_label: str
+    task_path: Path | None = None
+
+
+def _evaluate_replay_job(job: _ReplayJob) -> EvaluationResult:
+    return evaluate_run_replay(
+        bundle_path=job.bundle_path,
+        run=job.run,
+        cli_command=job.cli_command,
+        log_dir=job.log_dir,
+        timeout_seconds=job.timeout_seconds,
+        run_label=job.run_label,
+        task_path=job.task_path,
+    )
 
 
 def build_batches(run_ids: list[str], batch_size: int) -> list[list[str]]:
@@ -843,7 +1150,7 @@ def _format_preflight_diagnostic(
     return "\n".join(lines)
 
 
-def run_attribution_preflight(program: BundleProgram, trainset: list[dspy.Example]) -> None:
+def run_attribution_preflight(program: BundleProgram, trainset: Sequence[dspy.Example]) -> None:
     """
     Validate that the first batch produces practice-targeted feedback.
 
@@ -888,7 +1195,8 @@ def configure_reflection_lm(
     if reflection_lm == "test":
         return TestReflectionLM(transcript_recorder=transcript_recorder)
 
-    callbacks = [ReflectionLMTranscriptCallback(transcript_recorder)] if transcript_recorder is not None else None
+    attach_transcript = transcript_recorder is not None and transcript_recorder.enabled
+    callbacks = [ReflectionLMTranscriptCallback(transcript_recorder)] if attach_transcript else None
     return dspy.LM(reflection_lm, cache=cache_enabled, callbacks=callbacks)
 
 
@@ -906,6 +1214,10 @@ def _run_optimization(
     disable_dspy_cache: bool = typer.Option(False, help="Disable DSPy memory/disk caches"),
     ui: PromptOptUiMode | None = typer.Option(None, help="UI mode: live for TTY dashboard, plain for line output"),
     num_threads: int | None = typer.Option(None, help="GEPA/DSPy evaluation threads"),
+    executor: EvalExecutorKind = typer.Option(
+        EvalExecutorKind.SERIAL, help="How to run batch evaluations: serial, thread, or process"
+    ),
+    max_workers: int | None = typer.Option(None, help="Worker count for thread/process executors"),
 ):
     """
     Entry point for GEPA prompt optimization.
@@ -955,26 +1267,39 @@ def _run_optimization(
 
     seed_bundle = load_bundle(seed_bundle_path)
 
-    runs = {rid: load_run_artifact(runs_root, rid) for rid in run_ids}
+    if len(run_ids) > 1:
+        # Each artifact is several independent file reads; loading them on a
+        # short-lived pool makes startup wait on the slowest run, not the sum.
+        with ThreadPoolExecutor(max_workers=min(8, len(run_ids))) as pool:
+            runs = dict(zip(run_ids, pool.map(lambda rid: load_run_artifact(runs_root, rid), run_ids)))
+    else:
+        runs = {rid: load_run_artifact(runs_root, rid) for rid in run_ids}
 
     train_ids, dev_ids = split_devset(run_ids)
 
+    # Batches are stored as tuples: Example.__hash__ hashes its stored items,
+    # and an immutable run_ids value keeps that cheap and actually hashable
+    # when GEPA deduplicates examples internally.
     train_batches = build_batches(train_ids, batch_size)
-    trainset = [dspy.Example(run_ids=batch).with_inputs("run_ids") for batch in train_batches]
+    trainset = tuple(dspy.Example(run_ids=tuple(batch)).with_inputs("run_ids") for batch in train_batches)
 
     valset = None
     if dev_ids:
         val_batches = build_batches(dev_ids, batch_size)
-        valset = [dspy.Example(run_ids=batch).with_inputs("run_ids") for batch in val_batches]
+        valset = tuple(dspy.Example(run_ids=tuple(batch)).with_inputs("run_ids") for batch in val_batches)
 
     cache_enabled = not disable_dspy_cache
     effective_ui = _resolve_ui_mode(ui)
     status_sink, events_path = _build_status_sink(effective_ui, logs_root)
     previous_sink = set_current_status_sink(status_sink)
-    reflection_transcript_recorder = ReflectionTranscriptRecorder(enabled=REFLECTION_TRANSCRIPT_ENABLED)
+    reflection_transcript_recorder = ReflectionTranscriptRecorder(
+        enabled=REFLECTION_TRANSCRIPT_ENABLED,
+        raw_events_path=logs_root / "reflection_events.jsonl",
+    )
     reflection_transcript_path = logs_root / "reflection_transcript.md"
     raw_log_path = logs_root / "gepa_raw.log"
     completion_payload: dict[str, Any] | None = None
+    eval_executor = build_executor(executor, max_workers=max_workers)
 
     try:
         emit_status_event(
@@ -1013,7 +1338,10 @@ def _run_optimization(
             cache=cache,
             cli_command=resolved_cli_command,
             timeout=timeout_seconds,
+            executor=eval_executor,
         )
+        if valset is not None:
+            program.exempt_from_early_stop(example.run_ids for example in valset)
 
         emit_status_event("preflight_started", phase="preflight", summary="preflight started")
         try:
@@ -1094,9 +1422,11 @@ def _run_optimization(
         )
 
         emit_status_event("final_scoring_started", phase="final_scoring", summary="final scoring started")
-        evaluations = []
+        final_results: dict[str, EvaluationResult] = {}
+        pending_final: list[str] = []
+        cached_final = cache.get_many(run_ids, best_hash)
         for run_id in run_ids:
-            cached = cache.get(run_id, best_hash)
+            cached = cached_final.get(run_id)
             if cached:
                 emit_status_event(
                     "eval_cache_hit",
@@ -1106,22 +1436,33 @@ def _run_optimization(
                     task_id=run_id,
                     score=cached.score,
                 )
-                evaluations.append(cached)
+                final_results[run_id] = cached
                 continue
-
-            run = runs[run_id]
-            result = evaluate_run_replay(
-                bundle_path=written_bundle.path,
-                run=run,
-                cli_command=resolved_cli_command,
-                log_dir=logs_root,
-                timeout_seconds=timeout_seconds,
-                run_label=run_id,
-            )
-            cache.set(run_id, best_hash, result)
-            evaluations.append(result)
-
-        final_score = sum(evaluation.score for evaluation in evaluations) / max(len(evaluations), 1)
+            pending_final.append(run_id)
+
+        if pending_final:
+            # Same executor fan-out as forward(): final scoring is one replay
+            # per run, all independent and subprocess-bound.
+            final_jobs = [
+                _ReplayJob(
+                    bundle_path=written_bundle.path,
+                    run=runs[run_id],
+                    cli_command=resolved_cli_command,
+                    log_dir=logs_root,
+                    timeout_seconds=timeout_seconds,
+                    run_label=run_id,
+                    task_path=program._get_or_build_task_dir(runs[run_id]),
+                )
+                for run_id in pending_final
+            ]
+            final_writes = []
+            for run_id, result in zip(pending_final, eval_executor.map(_evaluate_replay_job, final_jobs)):
+                final_writes.append((run_id, best_hash, result))
+                final_results[run_id] = result
+            cache.set_many(final_writes)
+
+        evaluations = [final_results[run_id] for run_id in run_ids]
+        final_score = EvaluationResult.mean_score(evaluations)
         emit_status_event(
             "final_score",
             summary=f"best score={final_score}",
@@ -1132,7 +1473,7 @@ def _run_optimization(
             active_json,
             written_bundle.bundle_id,
             {
-                "updatedAt": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
+                "updatedAt": _utc_timestamp(),
                 "parentBundleId": seed_bundle.bundle_id,
                 "score": final_score,
                 "trainRunIds": train_ids,
@@ -1160,6 +1501,7 @@ def _run_optimization(
                 summary="warning: failed to write reflection transcript",
                 message=f"reflection transcript write failed: {exc}",
             )
+        reflection_transcript_recorder.close()
 
         if completion_payload is not None:
             emit_status_event(
@@ -1171,6 +1513,7 @@ def _run_optimization(
                 reflection_transcript_path=str(reflection_transcript_path),
             )
 
+        eval_executor.close()
         status_sink.close()
         set_current_status_sink(previous_sink)
 
@@ -1187,6 +1530,36 @@ def _safe_remove_path(path: Path) -> None:
     path.unlink(missing_ok=True)
 
 
+def _scan_clean_targets(directory: Path, prefix: str | None = None) -> list[tuple[str, bool]]:
+    """
+    List (path, is_dir) removal targets via one scandir pass.
+
+    DirEntry carries the type information from the directory scan itself, so
+    no per-target symlink/exists/dir stat triple is needed later; symlinks
+    report is_dir False (follow_symlinks=False) and are unlinked as files.
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return [
+                (entry.path, entry.is_dir(follow_symlinks=False) and not entry.is_symlink())
+                for entry in entries
+                if prefix is None or entry.name.startswith(prefix)
+            ]
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+
+
+def _remove_clean_target(target: tuple[str, bool]) -> None:
+    path, is_dir = target
+    if is_dir:
+        shutil.rmtree(path)
+        return
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+
+
 def _run_clean(promptopt_root: str) -> None:
     root = Path(promptopt_root)
     active_json = root / "active.json"
@@ -1195,18 +1568,22 @@ def _run_clean(promptopt_root: str) -> None:
     cache_evals_root = root / "cache" / "evals"
 
     _safe_remove_path(active_json)
-
-    if logs_root.exists() and logs_root.is_dir():
-        for child in list(logs_root.iterdir()):
-            _safe_remove_path(child)
-
-    if bundles_root.exists() and bundles_root.is_dir():
-        for child in list(bundles_root.glob("gen*")):
-            _safe_remove_path(child)
-
-    if cache_evals_root.exists() and cache_evals_root.is_dir():
-        for child in list(cache_evals_root.iterdir()):
-            _safe_remove_path(child)
+    # Removing generation bundles invalidates the content-hash index; a stale
+    # index left behind would claim bundles that no longer exist.
+    _safe_remove_path(bundles_root / ".index.json")
+
+    targets = _scan_clean_targets(logs_root)
+    targets += _scan_clean_targets(bundles_root, prefix="gen")
+    targets += _scan_clean_targets(cache_evals_root)
+
+    if len(targets) > 1:
+        # Deletion is unlink-syscall bound; removing generation dirs and log
+        # trees concurrently overlaps that latency across targets.
+        with ThreadPoolExecutor(max_workers=min(8, len(targets))) as pool:
+            list(pool.map(_remove_clean_target, targets))
+    else:
+        for target in targets:
+            _remove_clean_target(target)
 
 
 @app.callback(invoke_without_command=True)
@@ -1227,6 +1604,10 @@ def main(
     disable_dspy_cache: bool = typer.Option(False, help="Disable DSPy memory/disk caches"),
     ui: PromptOptUiMode | None = typer.Option(None, help="UI mode: live for TTY dashboard, plain for line output"),
     num_threads: int | None = typer.Option(None, help="GEPA/DSPy evaluation threads"),
+    executor: EvalExecutorKind = typer.Option(
+        EvalExecutorKind.SERIAL, help="How to run batch evaluations: serial, thread, or process"
+    ),
+    max_workers: int | None = typer.Option(None, help="Worker count for thread/process executors"),
 ):
     if ctx.invoked_subcommand is not None:
         return
@@ -1242,6 +1623,8 @@ def main(
         disable_dspy_cache=disable_dspy_cache,
         ui=ui,
         num_threads=num_threads,
+        executor=executor,
+        max_workers=max_workers,
     )
 
 
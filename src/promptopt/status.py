@@ -3,15 +3,30 @@ from __future__ import annotations
 import json
 import sys
 import threading
+import time
 from dataclasses import asdict, dataclass, field
-from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
 from typing import Any, Protocol
 
+_last_ts_second = -1
+_last_ts_value = ""
+
 
 def utc_timestamp() -> str:
-    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+    """
+    Second-resolution UTC timestamp for status events.
+
+    Events only need second granularity, so the formatted string is cached
+    until the clock ticks over — heartbeats fanning out across parallel
+    evaluators reuse one string instead of formatting a datetime per event.
+    """
+    global _last_ts_second, _last_ts_value
+    second = int(time.time())
+    if second != _last_ts_second:
+        _last_ts_value = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(second))
+        _last_ts_second = second
+    return _last_ts_value
 
 
 class PromptOptUiMode(str, Enum):
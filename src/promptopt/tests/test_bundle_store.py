@@ -1,4 +1,5 @@
 import json
+import shutil
 from pathlib import Path
 
 import pytest
@@ -64,6 +65,96 @@ def test_write_bundle_preserves_agents_passthrough_files(tmp_path: Path):
     assert (written.path / "agents" / "tools.md").read_text() == "# SDK Tool Usage Contract (Auto-generated)\n- sdk contract"
 
 
+def test_write_bundle_merges_metadata_on_republication(tmp_path: Path):
+    seed_path = tmp_path / "bundles" / "seed"
+    practices_dir = seed_path / "practices"
+    practices_dir.mkdir(parents=True)
+    (practices_dir / "simple.md").write_text("---\nName: simple\n---\n\nBody")
+
+    seed_bundle = load_bundle(seed_path)
+    first = write_bundle(
+        bundle_root=tmp_path / "bundles",
+        bundle=seed_bundle,
+        parent_id="seed",
+        generation="gepa",
+    )
+    second = write_bundle(
+        bundle_root=tmp_path / "bundles",
+        bundle=seed_bundle,
+        parent_id="seed",
+        generation="gepa",
+        metadata={"trainRunIds": ["run-1"]},
+        exist_ok=True,
+    )
+
+    assert second.bundle_id == first.bundle_id
+    # The re-publication keeps the original created_at but must still
+    # persist the newly supplied metadata.
+    assert second.meta["created_at"] == first.meta["created_at"]
+    assert second.meta["trainRunIds"] == ["run-1"]
+    on_disk = json.loads((second.path / "meta.json").read_text())
+    assert on_disk["trainRunIds"] == ["run-1"]
+
+
+def test_extract_name_falls_back_on_whitespace_only_value():
+    from promptopt.bundle_store import _extract_name
+
+    assert _extract_name("Name: tdd_spirit", "fallback.md") == "tdd_spirit"
+    assert _extract_name("Name:   ", "fallback.md") == "fallback.md"
+
+
+def test_write_bundle_ignores_stale_index_entry(tmp_path: Path, monkeypatch):
+    from promptopt import bundle_store
+
+    seed_path = tmp_path / "bundles" / "seed"
+    practices_dir = seed_path / "practices"
+    practices_dir.mkdir(parents=True)
+    (practices_dir / "simple.md").write_text("---\nName: simple\n---\n\nBody")
+
+    seed_bundle = load_bundle(seed_path)
+    first = write_bundle(
+        bundle_root=tmp_path / "bundles",
+        bundle=seed_bundle,
+        parent_id="seed",
+        generation="gepa",
+        exist_ok=False,
+    )
+
+    # `promptopt clean` removes gen* directories out-of-band; a fresh process
+    # would then load an .index.json that still claims the bundle exists.
+    shutil.rmtree(first.path)
+    monkeypatch.setattr(bundle_store, "_index_cache", {})
+
+    republished = write_bundle(
+        bundle_root=tmp_path / "bundles",
+        bundle=seed_bundle,
+        parent_id="seed",
+        generation="gepa",
+        exist_ok=False,
+    )
+
+    assert republished.bundle_id == first.bundle_id
+    assert (republished.path / "practices" / "simple.md").exists()
+
+
+def test_build_bundle_from_seed_shares_unchanged_practices(tmp_path: Path):
+    bundle_path = tmp_path / "bundles" / "seed"
+    practices_dir = bundle_path / "practices"
+    practices_dir.mkdir(parents=True)
+
+    (practices_dir / "static.md").write_text("---\nName: static\n---\n\nStays the same")
+    (practices_dir / "edited.md").write_text("---\nName: edited\n---\n\nOriginal")
+
+    seed_bundle = load_bundle(bundle_path)
+    updated_bundle = build_bundle_from_seed(seed_bundle, {"edited.md": "Updated"})
+
+    # Unchanged practices reuse the seed object, so cached digests and
+    # rendered bytes carry over to hash_bundle/write_bundle untouched.
+    assert updated_bundle.practices["static.md"] is seed_bundle.practices["static.md"]
+    assert updated_bundle.practices["edited.md"] is not seed_bundle.practices["edited.md"]
+    assert updated_bundle.practices["edited.md"].body == "Updated"
+
+
 def test_ensure_active_bundle_bootstraps_seed_from_root_sources(tmp_path: Path):
     mystro_root = tmp_path / ".mystro"
     promptopt_root = mystro_root / "promptopt"
@@ -0,0 +1,67 @@
+from pathlib import Path
+
+from promptopt.cache import EvaluationCache
+from promptopt.models import EvaluationResult
+
+
+def _result(score: float) -> EvaluationResult:
+    return EvaluationResult(passed=True, score=score)
+
+
+def test_cache_round_trip(tmp_path: Path, monkeypatch):
+    monkeypatch.setenv("PROMPTOPT_SYNC_WRITES", "1")
+    cache = EvaluationCache(tmp_path)
+
+    assert cache.get("run1", "hash1") is None
+    cache.set("run1", "hash1", _result(2.0))
+
+    loaded = cache.get("run1", "hash1")
+    assert loaded is not None
+    assert loaded.passed is True
+    assert loaded.score == 2.0
+
+
+def test_cache_memoizes_results_in_memory(tmp_path: Path, monkeypatch):
+    monkeypatch.setenv("PROMPTOPT_SYNC_WRITES", "1")
+    cache = EvaluationCache(tmp_path)
+    cache.set("run1", "hash1", _result(1.0))
+
+    first = cache.get("run1", "hash1")
+    # Repeated lookups return the memoized object without re-reading disk.
+    assert cache.get("run1", "hash1") is first
+
+    fresh = EvaluationCache(tmp_path)
+    disk_hit = fresh.get("run1", "hash1")
+    assert disk_hit is not None
+    # The disk hit is memoized too, so the next lookup is identity-stable.
+    assert fresh.get("run1", "hash1") is disk_hit
+
+
+def test_cache_get_many_mixes_hits_and_misses(tmp_path: Path, monkeypatch):
+    monkeypatch.setenv("PROMPTOPT_SYNC_WRITES", "1")
+    cache = EvaluationCache(tmp_path)
+    cache.set("run1", "hash1", _result(1.0))
+    cache.set("run2", "hash1", _result(2.0))
+
+    fresh = EvaluationCache(tmp_path)
+    results = fresh.get_many(["run1", "run2", "run3"], "hash1")
+
+    assert set(results) == {"run1", "run2", "run3"}
+    assert results["run1"].score == 1.0
+    assert results["run2"].score == 2.0
+    assert results["run3"] is None
+
+
+def test_cache_set_many_round_trips(tmp_path: Path, monkeypatch):
+    monkeypatch.setenv("PROMPTOPT_SYNC_WRITES", "1")
+    cache = EvaluationCache(tmp_path)
+    cache.set_many(
+        [
+            ("run1", "hash1", _result(1.0)),
+            ("run2", "hash1", _result(2.0)),
+        ]
+    )
+
+    fresh = EvaluationCache(tmp_path)
+    assert fresh.get("run1", "hash1").score == 1.0
+    assert fresh.get("run2", "hash1").score == 2.0
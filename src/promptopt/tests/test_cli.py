@@ -229,6 +229,7 @@ def test_cli_clean_removes_targets_and_preserves_non_gen_entries(tmp_path):
     bundles_root.mkdir(parents=True)
     (bundles_root / "gen001").mkdir()
     (bundles_root / "gen-file.txt").write_text("gen")
+    (bundles_root / ".index.json").write_text("{}")
     keep_bundle.mkdir()
     (keep_bundle / "notes.txt").write_text("keep")
     nested_gen.mkdir()
@@ -253,6 +254,7 @@ def test_cli_clean_removes_targets_and_preserves_non_gen_entries(tmp_path):
     assert list(logs_root.iterdir()) == []
     assert not (bundles_root / "gen001").exists()
     assert not (bundles_root / "gen-file.txt").exists()
+    assert not (bundles_root / ".index.json").exists()
     assert keep_bundle.exists()
     assert nested_gen.exists()
     assert cache_evals_root.exists()
@@ -297,6 +299,7 @@ def test_bundle_program_forward_uses_feedback(tmp_path):
 
     cache = MagicMock()
     cache.get.return_value = None
+    cache.get_many.side_effect = lambda run_ids, bundle_hash: {run_id: None for run_id in run_ids}
 
     program = BundleProgram(
         seed_bundle=seed_bundle,
@@ -355,6 +358,7 @@ def test_bundle_program_targets_only_implicated_practices(tmp_path):
 
     cache = MagicMock()
     cache.get.return_value = None
+    cache.get_many.side_effect = lambda run_ids, bundle_hash: {run_id: None for run_id in run_ids}
 
     program = BundleProgram(
         seed_bundle=seed_bundle,
@@ -419,6 +423,7 @@ def test_bundle_program_no_attribution_warns_and_freezes(tmp_path):
 
     cache = MagicMock()
     cache.get.return_value = None
+    cache.get_many.side_effect = lambda run_ids, bundle_hash: {run_id: None for run_id in run_ids}
 
     program = BundleProgram(
         seed_bundle=seed_bundle,
@@ -479,6 +484,7 @@ def test_bundle_program_excludes_agents_templates_from_predictors(tmp_path):
     )
     cache = MagicMock()
     cache.get.return_value = None
+    cache.get_many.side_effect = lambda run_ids, bundle_hash: {run_id: None for run_id in run_ids}
 
     program = BundleProgram(
         seed_bundle=seed_bundle,
@@ -519,6 +525,7 @@ def test_bundle_program_offending_without_notes_does_not_mutate(tmp_path):
 
     cache = MagicMock()
     cache.get.return_value = None
+    cache.get_many.side_effect = lambda run_ids, bundle_hash: {run_id: None for run_id in run_ids}
 
     program = BundleProgram(
         seed_bundle=seed_bundle,
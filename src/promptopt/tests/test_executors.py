@@ -0,0 +1,29 @@
+from promptopt.executors import (
+    EvalExecutorKind,
+    LocalExecutor,
+    SerialExecutor,
+    ThreadExecutor,
+    build_executor,
+)
+
+
+def test_build_executor_returns_serial_by_default():
+    executor = build_executor(EvalExecutorKind.SERIAL)
+    assert isinstance(executor, SerialExecutor)
+
+
+def test_build_executor_kinds():
+    assert isinstance(build_executor(EvalExecutorKind.THREAD, max_workers=2), ThreadExecutor)
+    assert isinstance(build_executor(EvalExecutorKind.PROCESS, max_workers=2), LocalExecutor)
+
+
+def test_serial_executor_preserves_order():
+    executor = SerialExecutor()
+    assert executor.map(lambda x: x * 2, [3, 1, 2]) == [6, 2, 4]
+    executor.close()
+
+
+def test_thread_executor_preserves_order():
+    executor = ThreadExecutor(max_workers=2)
+    assert executor.map(lambda x: x + 1, [5, 6, 7]) == [6, 7, 8]
+    executor.close()
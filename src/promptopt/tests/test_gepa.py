@@ -1,6 +1,7 @@
 import pytest
 import shutil
 import json
+import subprocess
 from pathlib import Path
 from unittest.mock import patch
 from promptopt.gepa_driver import load_split, create_candidate_bundle, evaluate_bundle
@@ -107,6 +108,20 @@ def test_create_candidate_bundle_exists(temp_workspace):
         create_candidate_bundle("seed", bundle_root, 1, practices)
 
 
+def test_merge_frontmatter_body_preserves_frontmatter():
+    from promptopt.gepa_driver import _merge_frontmatter_body
+
+    original = "---\nName: sample\n---\n\nOld body"
+    assert _merge_frontmatter_body(original, "New body") == "---\nName: sample\n---\n\nNew body"
+
+
+def test_merge_frontmatter_body_without_frontmatter_returns_new_body():
+    from promptopt.gepa_driver import _merge_frontmatter_body
+
+    assert _merge_frontmatter_body("Plain body, no frontmatter", "New body") == "New body"
+    assert _merge_frontmatter_body("---\nunterminated frontmatter", "New body") == "New body"
+
+
 @patch("promptopt.evaluator_client.subprocess.Popen")
 def test_evaluate_bundle_contract(mock_popen, temp_workspace):
     log_dir = temp_workspace["root"] / "logs"
@@ -121,7 +136,7 @@ def test_evaluate_bundle_contract(mock_popen, temp_workspace):
         def kill(self):
             pass
 
-        def wait(self):
+        def wait(self, timeout=None):
             return 0
 
     def side_effect_success(*args, **kwargs):
@@ -171,7 +186,7 @@ def test_evaluate_bundle_preserves_explicit_long_ui_flag(mock_popen, temp_worksp
         def kill(self):
             pass
 
-        def wait(self):
+        def wait(self, timeout=None):
             return 0
 
     def side_effect(*args, **kwargs):
@@ -208,7 +223,7 @@ def test_evaluate_bundle_preserves_explicit_short_ui_flag(mock_popen, temp_works
         def kill(self):
             pass
 
-        def wait(self):
+        def wait(self, timeout=None):
             return 0
 
     def side_effect(*args, **kwargs):
@@ -248,7 +263,9 @@ def test_evaluate_bundle_timeout_retry(mock_popen, temp_workspace):
         def kill(self):
             pass
 
-        def wait(self):
+        def wait(self, timeout=None):
+            if timeout is not None:
+                raise subprocess.TimeoutExpired(cmd="mystro-cli", timeout=timeout)
             return -9
 
     class _SuccessProcess:
@@ -258,7 +275,7 @@ def test_evaluate_bundle_timeout_retry(mock_popen, temp_workspace):
         def kill(self):
             pass
 
-        def wait(self):
+        def wait(self, timeout=None):
             return 0
 
     def side_effect_timeout_then_success(*args, **kwargs):
@@ -300,7 +317,7 @@ def test_evaluate_bundle_no_retry_if_evaluator_exists(mock_popen, temp_workspace
         def kill(self):
             pass
 
-        def wait(self):
+        def wait(self, timeout=None):
             return 1
 
     def side_effect_crash_with_json(*args, **kwargs):
@@ -326,24 +343,109 @@ def test_evaluate_bundle_no_retry_if_evaluator_exists(mock_popen, temp_workspace
     assert mock_popen.call_count == 1
 
 
-@patch("promptopt.evaluator_client.time.sleep", return_value=None)
-@patch("promptopt.evaluator_client.time.monotonic", side_effect=[0.0, 15.1, 15.1])
+def test_evaluate_bundles_async_runs_all_tasks(monkeypatch, temp_workspace):
+    import asyncio
+    from promptopt import evaluator_client
+
+    log_dir = temp_workspace["root"] / "logs_async"
+    log_dir.mkdir()
+
+    class _Process:
+        returncode = 0
+
+        def kill(self):
+            pass
+
+        async def wait(self):
+            return 0
+
+    async def fake_exec(*cmd, **kwargs):
+        out_dir = Path(cmd[cmd.index("--out") + 1])
+        out_dir.mkdir(parents=True, exist_ok=True)
+        (out_dir / "evaluator.json").write_text('{"pass": true, "score": 2.0}')
+        return _Process()
+
+    monkeypatch.setattr(evaluator_client.asyncio, "create_subprocess_exec", fake_exec)
+
+    results = asyncio.run(
+        evaluator_client.evaluate_bundles_async(
+            bundle_path=temp_workspace["bundles_dir"] / "gen1_async",
+            task_paths=[
+                temp_workspace["root"] / "bench" / "tasks" / "task1",
+                temp_workspace["root"] / "bench" / "tasks" / "task2",
+            ],
+            cli_command="mystro-cli",
+            log_dir=log_dir,
+            timeout_seconds=10,
+        )
+    )
+
+    assert [result.passed for result in results] == [True, True]
+    assert [result.score for result in results] == [2.0, 2.0]
+    assert (log_dir / "gen1_async" / "task1" / "evaluator.json").exists()
+    assert (log_dir / "gen1_async" / "task2" / "evaluator.json").exists()
+
+
 @patch("promptopt.evaluator_client.subprocess.Popen")
-def test_evaluate_bundle_emits_heartbeat(mock_popen, _mock_monotonic, _mock_sleep, temp_workspace):
+def test_evaluate_bundles_batch_runs_all_tasks(mock_popen, temp_workspace):
+    from promptopt import evaluator_client
+
+    log_dir = temp_workspace["root"] / "logs_batch"
+    log_dir.mkdir()
+
+    class _Process:
+        def poll(self):
+            return 0
+
+        def kill(self):
+            pass
+
+        def wait(self, timeout=None):
+            return 0
+
+    def side_effect_success(*args, **kwargs):
+        cmd = args[0]
+        out_dir = Path(cmd[cmd.index("--out") + 1])
+        out_dir.mkdir(parents=True, exist_ok=True)
+        (out_dir / "evaluator.json").write_text('{"pass": true, "score": 3.0}')
+        return _Process()
+
+    mock_popen.side_effect = side_effect_success
+
+    results = evaluator_client.evaluate_bundles_batch(
+        bundle_path=temp_workspace["bundles_dir"] / "gen1_batch",
+        task_paths=[
+            temp_workspace["root"] / "bench" / "tasks" / "task1",
+            temp_workspace["root"] / "bench" / "tasks" / "task2",
+        ],
+        cli_command="mystro-cli",
+        log_dir=log_dir,
+        timeout_seconds=10,
+    )
+
+    assert [result.passed for result in results] == [True, True]
+    assert [result.score for result in results] == [3.0, 3.0]
+    assert mock_popen.call_count == 2
+
+
+@patch("promptopt.evaluator_client.time.monotonic", side_effect=[0.0, 0.0, 15.1, 15.1])
+@patch("promptopt.evaluator_client.subprocess.Popen")
+def test_evaluate_bundle_emits_heartbeat(mock_popen, _mock_monotonic, temp_workspace):
     log_dir = temp_workspace["root"] / "logs_heartbeat"
     log_dir.mkdir()
 
     class _HeartbeatProcess:
         def __init__(self):
-            self._poll_values = [None, 0]
-
-        def poll(self):
-            return self._poll_values.pop(0)
+            # First wait() times out (triggering a heartbeat), second exits.
+            self._timed_out = False
 
         def kill(self):
             pass
 
-        def wait(self):
+        def wait(self, timeout=None):
+            if timeout is not None and not self._timed_out:
+                self._timed_out = True
+                raise subprocess.TimeoutExpired(cmd="mystro-cli", timeout=timeout)
             return 0
 
     def side_effect(*args, **kwargs):
@@ -1,3 +1,4 @@
+import json
 import shutil
 from unittest.mock import patch
 import pytest
@@ -247,6 +248,175 @@ def test_reflection_transcript_markdown_preserves_call_order(tmp_path):
     assert "second output" in transcript
 
 
+def test_reflection_recorder_appends_raw_event_journal(tmp_path):
+    raw_events_path = tmp_path / "reflection_events.jsonl"
+    recorder = ReflectionTranscriptRecorder(enabled=True, raw_events_path=raw_events_path)
+
+    recorder.start(call_id="call-1", prompt="a prompt", messages=None, kwargs={})
+    recorder.end(call_id="call-1", outputs=["an output"], exception=None)
+    recorder.close()
+
+    lines = raw_events_path.read_text().splitlines()
+    assert len(lines) == 2
+    start_record = json.loads(lines[0])
+    end_record = json.loads(lines[1])
+    assert start_record["event"] == "reflection_start"
+    assert start_record["prompt"] == "a prompt"
+    assert end_record["event"] == "reflection_end"
+    assert end_record["outputs_text"] == "an output"
+
+
+def test_forward_reuses_written_bundle_for_unchanged_candidate(tmp_path):
+    from dspy.utils import DummyLM
+    from promptopt.models import Bundle, PracticeAttribution, PracticeFile
+    from promptopt import run_gepa as run_gepa_module
+
+    dspy.configure(lm=DummyLM({ "": { "response": "ok" } }))
+
+    practice = PracticeFile(
+        file_name="simple.md",
+        name="simple",
+        frontmatter="Name: simple",
+        body="Hello",
+    )
+    seed_bundle = Bundle(
+        bundle_id="seed",
+        path=tmp_path / "seed",
+        practices={"simple.md": practice},
+        meta={},
+    )
+    run = RunArtifact(
+        run_id="run-1",
+        run_dir=tmp_path / "run-1",
+        goal="Do it",
+        base_commit="abc",
+    )
+
+    cache = type(
+        "Cache",
+        (),
+        {
+            "get": lambda *args, **kwargs: None,
+            "get_many": lambda self, run_ids, bundle_hash: {run_id: None for run_id in run_ids},
+            "set": lambda *args, **kwargs: None,
+            "set_many": lambda *args, **kwargs: None,
+        },
+    )()
+    program = BundleProgram(
+        seed_bundle=seed_bundle,
+        runs_by_id={"run-1": run},
+        bundle_root=tmp_path / "bundles",
+        log_dir=tmp_path / "logs",
+        cache=cache,
+        cli_command="cli",
+        timeout=5,
+    )
+    eval_result = EvaluationResult(
+        passed=True,
+        score=0.9,
+        practice_attribution=PracticeAttribution(notes_by_practice={"simple": ["ADD_LINE: x"]}),
+    )
+
+    sink = RecordingStatusSink()
+    previous_sink = set_current_status_sink(sink)
+    try:
+        with (
+            patch(
+                "promptopt.run_gepa.write_bundle",
+                side_effect=run_gepa_module.write_bundle,
+            ) as mock_write,
+            patch("promptopt.run_gepa.evaluate_bundle", return_value=eval_result),
+        ):
+            program.forward(["run-1"])
+            program.forward(["run-1"])
+    finally:
+        set_current_status_sink(previous_sink)
+
+    # Same instructions -> same content hash -> a single materialization.
+    assert mock_write.call_count == 1
+
+
+def test_forward_early_stops_plateaued_batch(tmp_path, monkeypatch):
+    from dspy.utils import DummyLM
+    from promptopt.models import Bundle, PracticeAttribution, PracticeFile
+
+    dspy.configure(lm=DummyLM({ "": { "response": "ok" } }))
+    monkeypatch.setenv("PROMPTOPT_EARLY_STOP_PATIENCE", "2")
+
+    practice = PracticeFile(
+        file_name="simple.md",
+        name="simple",
+        frontmatter="Name: simple",
+        body="Hello",
+    )
+    seed_bundle = Bundle(
+        bundle_id="seed",
+        path=tmp_path / "seed",
+        practices={"simple.md": practice},
+        meta={},
+    )
+    runs_by_id = {
+        run_id: RunArtifact(
+            run_id=run_id,
+            run_dir=tmp_path / run_id,
+            goal="Do it",
+            base_commit="abc",
+        )
+        for run_id in ("run-1", "run-2", "run-3")
+    }
+
+    cache = type(
+        "Cache",
+        (),
+        {
+            "get": lambda *args, **kwargs: None,
+            "get_many": lambda self, run_ids, bundle_hash: {run_id: None for run_id in run_ids},
+            "set": lambda *args, **kwargs: None,
+            "set_many": lambda *args, **kwargs: None,
+        },
+    )()
+    program = BundleProgram(
+        seed_bundle=seed_bundle,
+        runs_by_id=runs_by_id,
+        bundle_root=tmp_path / "bundles",
+        log_dir=tmp_path / "logs",
+        cache=cache,
+        cli_command="cli",
+        timeout=5,
+    )
+    eval_result = EvaluationResult(
+        passed=True,
+        score=0.5,
+        practice_attribution=PracticeAttribution(notes_by_practice={"simple": ["note"]}),
+    )
+
+    sink = RecordingStatusSink()
+    previous_sink = set_current_status_sink(sink)
+    try:
+        with patch("promptopt.run_gepa.evaluate_bundle", return_value=eval_result) as mock_eval:
+            # Three flat scores on the same batch trip the patience-2 plateau.
+            for _ in range(3):
+                program.forward(["run-1"])
+            assert any(event.kind == "gepa_early_stop" for event in sink.events)
+
+            # The stopped batch answers from its best earlier evaluation.
+            stopped = program.forward(["run-1"])
+            assert mock_eval.call_count == 3
+            assert stopped.score == 0.5
+
+            # An unseen batch is still evaluated for real after the stop.
+            program.forward(["run-2"])
+            assert mock_eval.call_count == 4
+
+            # Exempt (valset) batches never plateau, however flat their scores.
+            program.exempt_from_early_stop([("run-3",)])
+            for _ in range(4):
+                program.forward(["run-3"])
+            assert mock_eval.call_count == 8
+    finally:
+        set_current_status_sink(previous_sink)
+
+
 def test_bundle_program_emits_rollout_progress_events(tmp_path):
     from dspy.utils import DummyLM
     from promptopt.models import Bundle, PracticeAttribution, PracticeFile
@@ -272,7 +442,16 @@ def test_bundle_program_emits_rollout_progress_events(tmp_path):
         base_commit="abc",
     )
 
-    cache = type("Cache", (), {"get": lambda *args, **kwargs: None, "set": lambda *args, **kwargs: None})()
+    cache = type(
+        "Cache",
+        (),
+        {
+            "get": lambda *args, **kwargs: None,
+            "get_many": lambda self, run_ids, bundle_hash: {run_id: None for run_id in run_ids},
+            "set": lambda *args, **kwargs: None,
+            "set_many": lambda *args, **kwargs: None,
+        },
+    )()
     program = BundleProgram(
         seed_bundle=seed_bundle,
         runs_by_id={"run-1": run},